@@ -5,63 +5,104 @@ Run this script after setting your bot token, then send a message to your bot.
 """
 
 import asyncio
+import os
 import sys
 import aiohttp
 
-#!/usr/bin/env python3
-"""
-Helper script to get your Telegram chat ID.
-Run this script after setting your bot token, then send a message to your bot.
-"""
+# Long-polling timeout (seconds) passed to getUpdates
+POLL_TIMEOUT = 25
+# Number of long-poll cycles to wait for a message before giving up
+MAX_POLLS = 5
+# Last confirmed update offset, kept between runs so old updates are not re-downloaded
+OFFSET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.telegram_offset')
 
-import sys
-import requests
 
-def get_chat_id(bot_token: str):
-    """Get updates from the bot to find your chat ID using direct HTTP API."""
+def load_offset() -> int:
+    """Read the saved getUpdates offset, or 0 on first run."""
+    try:
+        with open(OFFSET_FILE) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return 0
+
+
+def save_offset(offset: int):
+    """Persist the next getUpdates offset."""
+    try:
+        with open(OFFSET_FILE, 'w') as f:
+            f.write(str(offset))
+    except OSError as e:
+        print(f"⚠️  Could not save update offset: {e}")
+
+
+async def get_chat_id(bot_token: str):
+    """Get updates from the bot to find your chat ID using Telegram long polling."""
     try:
         url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
-        
-        response = requests.get(url)
-        
-        if response.status_code != 200:
-            print(f"❌ Error: Bot token might be invalid. Status: {response.status_code}")
-            return None
-        
-        data = response.json()
-        
-        if not data.get('ok'):
-            print(f"❌ Error: {data.get('description', 'Unknown error')}")
-            return None
-        
-        updates = data.get('result', [])
-        
-        if not updates:
+        # Fail fast on connect while leaving room for the long-poll to complete
+        timeout = aiohttp.ClientTimeout(total=POLL_TIMEOUT + 10, sock_connect=10)
+        next_offset = load_offset()
+        # Unique chats seen, with the (first_name, username) of their first message
+        chats: dict[int, tuple[str, str]] = {}
+
+        # One session for every poll so the TCP/TLS connection is reused
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            for poll in range(MAX_POLLS):
+                # First call returns any backlog immediately, later calls long-poll
+                params = {
+                    "timeout": 0 if poll == 0 else POLL_TIMEOUT,
+                    "offset": next_offset,
+                    "limit": 100
+                }
+
+                async with session.get(url, params=params) as response:
+                    if response.status != 200:
+                        print(f"❌ Error: Bot token might be invalid. Status: {response.status}")
+                        return None
+
+                    data = await response.json()
+
+                if not data.get('ok'):
+                    print(f"❌ Error: {data.get('description', 'Unknown error')}")
+                    return None
+
+                updates = data.get('result', [])
+                for update in updates:
+                    message = update.get('message')
+                    if message:
+                        user = message.get('from', {})
+                        chats.setdefault(message['chat']['id'], (
+                            user.get('first_name', 'No name'),
+                            user.get('username', 'No username'),
+                        ))
+
+                if updates:
+                    next_offset = updates[-1]['update_id'] + 1
+                    save_offset(next_offset)
+                if chats:
+                    break
+
+                if poll == 0:
+                    print("No messages found yet. Send a message to @finance_helper_norman_bot now...")
+
+        if not chats:
             print("No messages found. Please send a message to your bot first!")
             print(f"Send a message to @finance_helper_norman_bot and run this script again.")
             return None
-        
+
         # Show all chat IDs found
         print("Found chat IDs:")
-        chat_ids = set()
-        for update in updates:
-            if 'message' in update:
-                message = update['message']
-                chat_id = message['chat']['id']
-                user = message.get('from', {})
-                username = user.get('username', 'No username')
-                first_name = user.get('first_name', 'No name')
-                chat_ids.add(chat_id)
-                print(f"  Chat ID: {chat_id} (User: {first_name}, @{username})")
-        
-        if len(chat_ids) == 1:
-            chat_id = list(chat_ids)[0]
+        for chat_id, (first_name, username) in chats.items():
+            print(f"  Chat ID: {chat_id} (User: {first_name}, @{username})")
+
+        if len(chats) == 1:
+            chat_id = next(iter(chats))
             print(f"\n✅ Your chat ID is: {chat_id}")
             return chat_id
         else:
             print(f"\n⚠️  Multiple chat IDs found. Use the one that corresponds to your account.")
             return None
-        
+
     except Exception as e:
         print(f"❌ Error: {e}")
         return None
@@ -71,6 +112,6 @@ if __name__ == "__main__":
         print("Usage: python3 get_chat_id.py <bot_token>")
         print("Example: python3 get_chat_id.py 123456789:ABCdefGHIjklMNOpqrsTUVwxyz")
         sys.exit(1)
-    
+
     bot_token = sys.argv[1]
-    get_chat_id(bot_token)
+    asyncio.run(get_chat_id(bot_token))
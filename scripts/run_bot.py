@@ -6,11 +6,13 @@ Simple script to run the trading bot.
 import sys
 import os
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add the project root to the path so the src package resolves
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
 from src.main import main
+from src.utils import install_uvloop
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
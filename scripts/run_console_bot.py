@@ -8,20 +8,22 @@ import asyncio
 import sys
 import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add the project root to the path so the src package resolves
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.main import TradingBotApp
+from src.main import main as run_console
+from src.utils import install_uvloop
 
 def main():
     """Run the console trading bot."""
     print("🚀 Console Trading Bot")
     print("=" * 30)
     
+    install_uvloop()
+    
     try:
-        # Run the bot
-        bot = TradingBotApp()
-        asyncio.run(bot.start())
+        # Run the bot through the app entry point so shutdown always closes its sessions
+        asyncio.run(run_console())
         
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
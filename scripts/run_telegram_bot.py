@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.telegram_bot import TelegramBot
 from src.config import load_config
+from src.utils import install_uvloop
 
 # Set up logging
 logging.basicConfig(
@@ -42,6 +43,8 @@ def main():
         print(f"🔗 Bot: @finance_helper_norman_bot")
         print("🚀 Starting bot...")
         
+        install_uvloop()
+        
         # Create and start bot
         bot = TelegramBot(config)
         
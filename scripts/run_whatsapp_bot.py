@@ -10,11 +10,12 @@ import signal
 import sys
 import os
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add the project root to the path so the src package resolves
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import load_config
 from src.whatsapp_bot import WhatsAppBot
+from src.utils import install_uvloop
 
 # Set up logging
 logging.basicConfig(
@@ -37,6 +38,8 @@ class WhatsAppTradingBotApp:
         self.config = None
         self.whatsapp_bot = None
         self.running = False
+        self._stop_event = asyncio.Event()
+        self._bot_task = None
     
     async def start(self):
         """Start the WhatsApp trading bot application."""
@@ -51,14 +54,13 @@ class WhatsAppTradingBotApp:
             
             # Start services
             logger.info("Starting WhatsApp bot...")
-            await self.whatsapp_bot.start()
+            self._bot_task = asyncio.create_task(self.whatsapp_bot.start())
             
             self.running = True
             logger.info("WhatsApp trading bot started successfully!")
             
-            # Keep running
-            while self.running:
-                await asyncio.sleep(1)
+            # Keep running until stop is requested (no periodic wakeups)
+            await self._stop_event.wait()
                 
         except Exception as e:
             logger.error(f"Error starting application: {e}")
@@ -69,16 +71,16 @@ class WhatsAppTradingBotApp:
         """Stop the WhatsApp trading bot application."""
         logger.info("Shutting down WhatsApp trading bot...")
         self.running = False
+        self._stop_event.set()
         
         if self.whatsapp_bot:
             await self.whatsapp_bot.stop()
         
+        # Let the message monitor loop finish its current iteration
+        if self._bot_task:
+            await self._bot_task
+        
         logger.info("WhatsApp trading bot stopped.")
-    
-    def handle_signal(self, signum, frame):
-        """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, shutting down...")
-        asyncio.create_task(self.stop())
 
 
 async def main():
@@ -88,9 +90,10 @@ async def main():
     
     app = WhatsAppTradingBotApp()
     
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, app.handle_signal)
-    signal.signal(signal.SIGTERM, app.handle_signal)
+    # Signals just wake the idle start() coroutine; shutdown then runs in finally
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, app._stop_event.set)
     
     try:
         await app.start()
@@ -104,4 +107,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Binance Handler Self-Test
+Exercise all BinanceHandler endpoints against the public API.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the project root to the path so the src package resolves
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.binance_handler import BinanceHandler
+from src.config import load_config
+from src.schemas import TradingAnalysis
+
+
+async def main():
+    """
+    Test all Binance handler endpoints to verify they work with public API.
+    """
+    print("🚀 Testing Binance Handler with Public API")
+    print("=" * 60)
+    
+    try:
+        # Initialize handler
+        config = load_config()
+        handler = BinanceHandler(config)
+        
+        print(f"📡 API Access: {handler.has_api_access}")
+        print(f"🌐 Base URL: {handler.base_url}")
+        print()
+        
+        # Test 1: Current BTC Price
+        print("1️⃣ Testing get_current_btc_price()...")
+        try:
+            price = await handler.get_current_btc_price()
+            print(f"   ✅ Current BTC Price: ${price:,.2f}")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 2: Price History
+        print("2️⃣ Testing fetch_btc_price_history()...")
+        try:
+            history = await handler.fetch_btc_price_history(7)  # Last 7 days
+            print(f"   ✅ Fetched {len(history)} days of price data")
+            if history:
+                latest = history[-1]
+                print(f"   📅 Latest: {latest.timestamp.strftime('%Y-%m-%d')} - Close: ${latest.close:.2f}")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 3: Account Balance (Demo)
+        print("3️⃣ Testing get_account_balance()...")
+        try:
+            balance = await handler.get_account_balance()
+            print(f"   ✅ Demo Balance:")
+            for asset, data in balance.items():
+                total = data['free'] + data['locked']
+                print(f"      {asset}: {total:.6f} (Free: {data['free']:.6f}, Locked: {data['locked']:.6f})")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 4: USDT Balance
+        print("4️⃣ Testing get_usdt_balance()...")
+        try:
+            usdt = await handler.get_usdt_balance()
+            print(f"   ✅ USDT Balance: {usdt:.2f} USDT")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 5: BTC Balance
+        print("5️⃣ Testing get_btc_balance()...")
+        try:
+            btc = await handler.get_btc_balance()
+            print(f"   ✅ BTC Balance: {btc:.6f} BTC")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 6: Portfolio Value
+        print("6️⃣ Testing get_portfolio_value_usdt()...")
+        try:
+            portfolio = await handler.get_portfolio_value_usdt()
+            print(f"   ✅ Portfolio Summary:")
+            print(f"      BTC Holdings: {portfolio['btc_balance']:.6f} BTC")
+            print(f"      BTC Price: ${portfolio['btc_price']:,.2f}")
+            print(f"      BTC Value: ${portfolio['btc_value_usdt']:,.2f} USDT")
+            print(f"      USDT Balance: ${portfolio['usdt_balance']:,.2f} USDT")
+            print(f"      Total Value: ${portfolio['total_value_usdt']:,.2f} USDT")
+            print(f"      BTC Allocation: {portfolio['btc_allocation_percent']:.1f}%")
+            print(f"      USDT Allocation: {portfolio['usdt_allocation_percent']:.1f}%")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 7: Buying Power
+        print("7️⃣ Testing get_btc_buying_power()...")
+        try:
+            buying_power = await handler.get_btc_buying_power()
+            print(f"   ✅ Buying Power Analysis:")
+            print(f"      USDT Balance: {buying_power['usdt_balance']:.2f} USDT")
+            print(f"      BTC Price: ${buying_power['btc_price']:,.2f}")
+            print(f"      Usable USDT (after fees): {buying_power['usable_usdt']:.2f} USDT")
+            print(f"      Max BTC Buyable: {buying_power['max_btc_buyable']:.6f} BTC")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 8: Trade Simulation
+        print("8️⃣ Testing execute_trade() (simulated)...")
+        try:
+            # Create a mock trading analysis
+            mock_analysis = TradingAnalysis(
+                intention="buy",
+                analysis="Test market analysis for simulation",
+                suggested_action="Buy 0.001 BTC for testing",
+                amount=0.001,
+                confidence=0.8,
+                risk_level="medium"
+            )
+            
+            result = await handler.execute_trade(mock_analysis)
+            print(f"   ✅ Trade Simulation Result:")
+            print(f"      Status: {result['status']}")
+            print(f"      Message: {result['message']}")
+            print(f"      Action: {result['action']}")
+            print(f"      Amount: {result['amount']} BTC")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 9: Buy Order Simulation
+        print("9️⃣ Testing place_buy_order() (simulated)...")
+        try:
+            buy_result = await handler.place_buy_order("BTCUSDT", 0.001)
+            print(f"   ✅ Buy Order Simulation:")
+            print(f"      Status: {buy_result['status']}")
+            print(f"      Message: {buy_result['message']}")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 10: Sell Order Simulation
+        print("🔟 Testing place_sell_order() (simulated)...")
+        try:
+            sell_result = await handler.place_sell_order("BTCUSDT", 0.001)
+            print(f"   ✅ Sell Order Simulation:")
+            print(f"      Status: {sell_result['status']}")
+            print(f"      Message: {sell_result['message']}")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        # Test 11: Format Price Data for LLM
+        print("1️⃣1️⃣ Testing format_price_data_for_llm()...")
+        try:
+            history = await handler.fetch_btc_price_history(5)  # Last 5 days
+            formatted = handler.format_price_data_for_llm(history)
+            print(f"   ✅ Formatted price data for LLM:")
+            print("   " + "\n   ".join(formatted.split("\n")[:10]))  # Show first 10 lines
+            print("   ... (truncated)")
+        except Exception as e:
+            print(f"   ❌ Error: {e}")
+        print()
+        
+        print("🎉 All endpoint tests completed!")
+        print("=" * 60)
+        
+        await handler.close()
+        
+    except Exception as e:
+        print(f"❌ Fatal error during testing: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,11 +7,12 @@ Installs Node.js dependencies for WhatsApp integration.
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def check_node_js():
     """Check if Node.js is installed."""
     try:
-        result = subprocess.run(['node', '--version'], capture_output=True, text=True)
+        result = subprocess.run(['node', '--version'], capture_output=True, text=True, timeout=5)
         if result.returncode == 0:
             print(f"✅ Node.js found: {result.stdout.strip()}")
             return True
@@ -21,11 +22,14 @@ def check_node_js():
     except FileNotFoundError:
         print("❌ Node.js not found")
         return False
+    except subprocess.TimeoutExpired:
+        print("❌ Node.js did not respond")
+        return False
 
 def check_npm():
     """Check if npm is installed."""
     try:
-        result = subprocess.run(['npm', '--version'], capture_output=True, text=True)
+        result = subprocess.run(['npm', '--version'], capture_output=True, text=True, timeout=5)
         if result.returncode == 0:
             print(f"✅ npm found: {result.stdout.strip()}")
             return True
@@ -35,8 +39,11 @@ def check_npm():
     except FileNotFoundError:
         print("❌ npm not found")
         return False
+    except subprocess.TimeoutExpired:
+        print("❌ npm did not respond")
+        return False
 
-def install_whatsapp_dependencies():
+def install_whatsapp_dependencies(quiet: bool = False):
     """Install WhatsApp bridge dependencies."""
     bridge_dir = os.path.join(os.path.dirname(__file__), 'whatsapp_bridge')
     
@@ -48,7 +55,20 @@ def install_whatsapp_dependencies():
         print("📦 Installing WhatsApp bridge dependencies...")
         os.chdir(bridge_dir)
         
-        result = subprocess.run(['npm', 'install'], capture_output=True, text=True)
+        # npm ci does a faster, reproducible install when a lockfile is committed
+        if os.path.exists('package-lock.json'):
+            install_command = ['npm', 'ci']
+        else:
+            install_command = ['npm', 'install']
+        
+        # Stream npm's install log to the terminal instead of buffering it;
+        # only stderr is captured for the failure message
+        result = subprocess.run(
+            install_command,
+            stdout=subprocess.DEVNULL if quiet else None,
+            stderr=subprocess.PIPE,
+            text=True
+        )
         
         if result.returncode == 0:
             print("✅ WhatsApp dependencies installed successfully")
@@ -69,13 +89,20 @@ def main():
     # Check prerequisites
     print("\n🔍 Checking prerequisites...")
     
-    if not check_node_js():
+    # The two version probes are independent, so run them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        node_future = executor.submit(check_node_js)
+        npm_future = executor.submit(check_npm)
+        has_node = node_future.result()
+        has_npm = npm_future.result()
+    
+    if not has_node:
         print("\n❌ Node.js is required for WhatsApp integration")
         print("📥 Install Node.js from: https://nodejs.org/")
         print("   Recommended: Download and install the LTS version")
         return False
     
-    if not check_npm():
+    if not has_npm:
         print("\n❌ npm is required (usually comes with Node.js)")
         return False
     
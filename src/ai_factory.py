@@ -3,22 +3,85 @@ AI Factory module.
 Creates the appropriate AI handler based on configuration.
 """
 
+import asyncio
+import importlib
 import logging
-from typing import Union
+from typing import TYPE_CHECKING, Union
 from .config import Config
-from .ollama_handler import OllamaHandler
-from .openai_handler import OpenAIHandler
-from .gemini_handler import GeminiHandler
+
+if TYPE_CHECKING:
+    # Handler modules pull in heavy SDKs, so they are only imported when used
+    from .ollama_handler import OllamaHandler
+    from .openai_handler import OpenAIHandler
+    from .gemini_handler import GeminiHandler
 
 logger = logging.getLogger(__name__)
 
 # Type alias for AI handlers
-AIHandler = Union[OllamaHandler, OpenAIHandler, GeminiHandler]
+AIHandler = Union["OllamaHandler", "OpenAIHandler", "GeminiHandler"]
+
+
+# Provider name -> (display name, handler module, handler class, API key attribute, model attribute)
+_PROVIDERS = {
+    "ollama": ("Ollama", ".ollama_handler", "OllamaHandler", None, "ollama_model"),
+    "openai": ("OpenAI", ".openai_handler", "OpenAIHandler", "openai_api_key", "openai_model"),
+    "gemini": ("Gemini", ".gemini_handler", "GeminiHandler", "gemini_api_key", "gemini_model"),
+}
 
 
 class AIFactory:
     """Factory class to create AI handlers based on configuration."""
     
+    # Handlers are shared per (provider, config) so their HTTP clients stay warm
+    _handler_cache: dict[tuple[str, int], AIHandler] = {}
+    
+    @classmethod
+    def _get_or_create_handler(cls, provider: str, config: Config) -> AIHandler:
+        """Return the cached handler for this provider and config, creating it on first use."""
+        key = (provider, id(config))
+        if key not in cls._handler_cache:
+            cls._handler_cache[key] = cls._load_handler_class(provider)(config)
+        return cls._handler_cache[key]
+    
+    @staticmethod
+    def _load_handler_class(provider: str) -> type:
+        """Import the handler class for a provider, loading only that provider's SDK."""
+        _, module_name, class_name, _, _ = _PROVIDERS[provider]
+        module = importlib.import_module(module_name, __package__)
+        return getattr(module, class_name)
+    
+    @staticmethod
+    def _create(config: Config, provider: str, purpose: str, role: str = "") -> AIHandler:
+        """
+        Look up a provider in the dispatch table and return its (cached) handler.
+        
+        Args:
+            config: Configuration object
+            provider: Provider name from configuration
+            purpose: What the handler is used for, for logging
+            role: Role prefix used in error messages (e.g. "analysis ")
+            
+        Raises:
+            ValueError: If the provider is not supported or its API key is missing
+        """
+        provider = provider.lower()
+        
+        cached = AIFactory._handler_cache.get((provider, id(config)))
+        if cached is not None:
+            return cached
+        
+        try:
+            display_name, _, _, key_attr, model_attr = _PROVIDERS[provider]
+        except KeyError:
+            raise ValueError(f"Unsupported {role}AI provider: {provider}. "
+                           "Supported providers: ollama, openai, gemini") from None
+        
+        if key_attr and not getattr(config, key_attr):
+            raise ValueError(f"{display_name} API key is required when using {display_name} {role}provider")
+        
+        logger.info(f"Creating {display_name} handler for {purpose} with model: {getattr(config, model_attr)}")
+        return AIFactory._get_or_create_handler(provider, config)
+    
     @staticmethod
     def create_handler(config: Config) -> AIHandler:
         """
@@ -34,27 +97,7 @@ class AIFactory:
         Raises:
             ValueError: If AI provider is not supported
         """
-        provider = config.ai_provider.lower()
-        
-        if provider == "ollama":
-            logger.info(f"Creating Ollama handler for intent classification with model: {config.ollama_model}")
-            return OllamaHandler(config)
-        
-        elif provider == "openai":
-            if not config.openai_api_key:
-                raise ValueError("OpenAI API key is required when using OpenAI provider")
-            logger.info(f"Creating OpenAI handler for intent classification with model: {config.openai_model}")
-            return OpenAIHandler(config)
-        
-        elif provider == "gemini":
-            if not config.gemini_api_key:
-                raise ValueError("Gemini API key is required when using Gemini provider")
-            logger.info(f"Creating Gemini handler for intent classification with model: {config.gemini_model}")
-            return GeminiHandler(config)
-        
-        else:
-            raise ValueError(f"Unsupported AI provider: {provider}. "
-                           "Supported providers: ollama, openai, gemini")
+        return AIFactory._create(config, config.ai_provider, "intent classification")
     
     @staticmethod
     def create_analysis_handler(config: Config) -> AIHandler:
@@ -71,32 +114,38 @@ class AIFactory:
         Raises:
             ValueError: If analysis AI provider is not supported
         """
-        provider = config.analysis_ai_provider.lower()
-        
-        if provider == "ollama":
-            logger.info(f"Creating Ollama handler for analysis with model: {config.ollama_model}")
-            return OllamaHandler(config)
-        
-        elif provider == "openai":
-            if not config.openai_api_key:
-                raise ValueError("OpenAI API key is required when using OpenAI analysis provider")
-            logger.info(f"Creating OpenAI handler for analysis with model: {config.openai_model}")
-            return OpenAIHandler(config)
-        
-        elif provider == "gemini":
-            if not config.gemini_api_key:
-                raise ValueError("Gemini API key is required when using Gemini analysis provider")
-            logger.info(f"Creating Gemini handler for analysis with model: {config.gemini_model}")
-            return GeminiHandler(config)
+        return AIFactory._create(config, config.analysis_ai_provider, "analysis", "analysis ")
+    
+    @staticmethod
+    def create_premium_handler(config: Config, provider: str) -> AIHandler:
+        """
+        Create the handler for a premium provider requested for an AI comparison.
         
-        else:
-            raise ValueError(f"Unsupported analysis AI provider: {provider}. "
-                           "Supported providers: ollama, openai, gemini")
+        Args:
+            config: Configuration object
+            provider: Requested provider name ("openai" or "gemini")
+            
+        Returns:
+            AI handler instance for the requested provider
+            
+        Raises:
+            ValueError: If the provider is not supported or its API key is missing
+        """
+        return AIFactory._create(config, provider, "premium comparison", "premium ")
     
     @staticmethod
     def get_available_providers() -> list[str]:
         """Get list of available AI providers."""
-        return ["ollama", "openai", "gemini"]
+        return list(_PROVIDERS)
+    
+    @staticmethod
+    def _is_configured(provider: str, config: Config) -> bool:
+        """Check whether a provider is in use or has an API key configured."""
+        if provider == "ollama":
+            return "ollama" in (config.ai_provider.lower(), config.analysis_ai_provider.lower())
+        
+        api_key = getattr(config, f"{provider}_api_key", "")
+        return bool(api_key) and not api_key.startswith("your_")
     
     @staticmethod
     async def test_provider_health(config: Config) -> dict[str, bool]:
@@ -109,36 +158,22 @@ class AIFactory:
         Returns:
             Dictionary mapping provider names to health status
         """
-        results = {}
+        results = {provider: False for provider in _PROVIDERS}
         
-        # Test Ollama
-        try:
-            ollama_handler = OllamaHandler(config)
-            results["ollama"] = await ollama_handler.health_check()
-        except Exception as e:
-            logger.error(f"Error testing Ollama: {e}")
-            results["ollama"] = False
+        async def check(provider: str) -> bool:
+            handler = AIFactory._get_or_create_handler(provider, config)
+            return await handler.health_check()
+        
+        # Only probe configured providers; the rest stay False without creating a handler
+        names = [provider for provider in results if AIFactory._is_configured(provider, config)]
         
-        # Test OpenAI (only if API key is configured)
-        if config.openai_api_key and not config.openai_api_key.startswith("your_"):
-            try:
-                openai_handler = OpenAIHandler(config)
-                results["openai"] = await openai_handler.health_check()
-            except Exception as e:
-                logger.error(f"Error testing OpenAI: {e}")
-                results["openai"] = False
-        else:
-            results["openai"] = False  # Not configured
+        # Run the independent health checks concurrently
+        statuses = await asyncio.gather(*(check(name) for name in names), return_exceptions=True)
         
-        # Test Gemini (only if API key is configured)
-        if config.gemini_api_key and not config.gemini_api_key.startswith("your_"):
-            try:
-                gemini_handler = GeminiHandler(config)
-                results["gemini"] = await gemini_handler.health_check()
-            except Exception as e:
-                logger.error(f"Error testing Gemini: {e}")
-                results["gemini"] = False
-        else:
-            results["gemini"] = False  # Not configured
+        for name, status in zip(names, statuses):
+            if isinstance(status, Exception):
+                logger.error(f"Error testing {name}: {status}")
+                status = False
+            results[name] = status
         
         return results
@@ -3,19 +3,84 @@ Binance API integration module.
 Handles price data fetching and trade execution.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import requests
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Dict, Any, NamedTuple, Optional, Tuple, Callable, Awaitable
 from .config import Config
 from .schemas import TradingAnalysis
+from .utils import json_dumps, json_loads
+
+# HTTP and Redis clients are imported on first use to keep module import cheap
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for transient Binance failures (exponential backoff).
+# 418 means the IP is banned, so it is never retried.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+# Longest Retry-After (seconds) worth waiting for inside a user request
+MAX_RETRY_AFTER = 5
+
+# Client-side request budget, well under Binance's 1200 weight/minute limit
+RATE_LIMIT_REQUESTS = 20
+RATE_LIMIT_PERIOD = 1.0
+# Maximum number of Binance requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+# Log a warning once the reported minute weight gets close to the limit
+USED_WEIGHT_WARNING = 1000
+
+
+class Kline(NamedTuple):
+    """One daily BTC candle."""
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class RateLimiter:
+    """Async context manager allowing at most max_rate entries per time_period, with bursts."""
+    
+    def __init__(self, max_rate: int, time_period: float = 1.0):
+        self._interval = time_period / max_rate
+        self._burst = time_period - self._interval
+        # Theoretical arrival time of the next request (GCRA)
+        self._tat = 0.0
+    
+    async def __aenter__(self):
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        # Reserve the slot before sleeping so concurrent callers queue behind it
+        self._tat = tat + self._interval
+        wait = tat - now - self._burst
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+# Cache lifetimes (seconds) for market data
+CACHE_TTL_PRICE = 5
+CACHE_TTL_HISTORY_SHORT = 600
+CACHE_TTL_BALANCE = 5
+
 
 class BinanceHandler:
     """Handles all Binance API interactions."""
     
+    # Fixed request paths and parameters, shared by every call
+    _price_path = "/api/v3/ticker/price"
+    _price_params = {"symbol": "BTCUSDT"}
+    _klines_path = "/api/v3/klines"
+    _klines_params = {"symbol": "BTCUSDT", "interval": "1d"}
+    
     def __init__(self, config: Config):
         """Initialize Binance handler using public API only."""
         self.config = config
@@ -27,9 +92,150 @@ class BinanceHandler:
         # Base URL for public API
         self.base_url = "https://api.binance.com"  # Always use mainnet public API
         
+        # Shared HTTP session, created lazily inside the running event loop
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._limiter = RateLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        # In-process market data cache: key -> (fetched_at, value), plus fetches in flight
+        self._cache: Dict[Any, Tuple[float, Any]] = {}
+        self._inflight: Dict[Any, asyncio.Task] = {}
+        
+        # Optional Redis cache shared between bot processes (Telegram, WhatsApp, ...)
+        self._redis = None
+        if config.redis_url:
+            try:
+                import redis.asyncio as redis_asyncio
+                self._redis = redis_asyncio.from_url(config.redis_url)
+            except ImportError:
+                logger.warning("REDIS_URL is set but the redis package is not installed - shared cache disabled")
+        
         logger.info("Binance handler initialized with public API access only")
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            
+            # Keep idle connections open between user requests to skip TCP/TLS setup
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            # Requests use paths relative to the API base URL
+            self._session = aiohttp.ClientSession(
+                base_url=self.base_url,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10, sock_connect=3.05)
+            )
+        return self._session
+    
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a public API path (e.g. /api/v3/klines) and decode its JSON body.
         
-    async def fetch_btc_price_history(self, days: int = 15) -> List[Dict[str, Any]]:
+        Throttling, 5xx responses and timeouts are retried; connection errors
+        (DNS failure, refused connection) are raised at once.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            delay = RETRY_BACKOFF * (2 ** attempt)
+            try:
+                async with self._semaphore, self._limiter, self._get_session().get(path, params=params) as response:
+                    used_weight = response.headers.get("X-MBX-USED-WEIGHT-1M")
+                    if used_weight and used_weight.isdigit() and int(used_weight) >= USED_WEIGHT_WARNING:
+                        logger.warning("Binance request weight at %s/1200 for this minute", used_weight)
+                    
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        # Rate limit responses say how long to back off
+                        retry_after = response.headers.get("Retry-After")
+                        if response.status == 429 and retry_after and retry_after.isdigit():
+                            if int(retry_after) > MAX_RETRY_AFTER:
+                                # Fail now rather than hold the request (and its slot) for the whole back-off
+                                logger.warning("Binance asked to back off for %ss, not retrying", retry_after)
+                                response.raise_for_status()
+                            delay = max(delay, float(retry_after))
+                        logger.warning("Binance returned %d, retrying in %.1fs", response.status, delay)
+                    else:
+                        response.raise_for_status()
+                        return await response.json(loads=json_loads)
+            except asyncio.TimeoutError as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                logger.warning("Binance request failed (%s), retrying in %.1fs", e, delay)
+            
+            # Back off outside the request so the connection and concurrency slot are released
+            await asyncio.sleep(delay)
+    
+    async def _cached(self, key: Any, ttl: float, fetch: Callable[[], Awaitable[Any]],
+                      redis_backed: bool = False) -> Any:
+        """
+        Return a cached value for key, calling fetch when it is missing or expired.
+        
+        Concurrent callers for the same key share one in-flight fetch and get its
+        result or error. When fetch reads through the Redis cache (redis_backed) and
+        Redis is configured, results are not kept in process as well.
+        """
+        keep_local = not (redis_backed and self._redis is not None)
+        hit = self._cache.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            def store(done: asyncio.Task):
+                self._inflight.pop(key, None)
+                # Redis already expires shared entries; a local copy on top would double their age
+                if keep_local and not done.cancelled() and done.exception() is None:
+                    self._cache[key] = (time.monotonic(), done.result())
+            
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(store)
+        
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _cache_get(self, key: str) -> Any:
+        """Read a JSON value from the shared Redis cache, or None on miss or when Redis is unset."""
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(key)
+        except Exception as e:
+            logger.warning(f"Redis get failed for {key}: {e}")
+            return None
+        if raw is None:
+            logger.debug("cache_miss %s", key)
+            return None
+        logger.debug("cache_hit %s", key)
+        return json_loads(raw)
+    
+    async def _cache_set(self, key: str, value: Any, ttl: int):
+        """Store a JSON value in the shared Redis cache with an expiry; no-op when Redis is unset."""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(key, json_dumps(value), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Redis set failed for {key}: {e}")
+    
+    async def close(self):
+        """Close the shared HTTP session and Redis connection."""
+        # Shielded fetches outlive their callers; stop them before the session goes away
+        pending = list(self._inflight.values())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._redis is not None:
+            await self._redis.aclose()
+        
+    async def fetch_btc_price_history(self, days: int = 15) -> List[Kline]:
         """
         Fetch BTC price history for the specified number of days using public API.
         
@@ -37,40 +243,50 @@ class BinanceHandler:
             days: Number of days to fetch data for
             
         Returns:
-            List of price data dictionaries
+            List of Kline rows, oldest first
         """
+        return await self._cached(
+            ("klines", "BTCUSDT", "1d", days),
+            CACHE_TTL_HISTORY_SHORT,
+            lambda: self._fetch_btc_price_history(days),
+            redis_backed=True
+        )
+    
+    async def _fetch_btc_price_history(self, days: int) -> List[Kline]:
+        """Download BTC daily klines from the public API."""
         try:
-            # Calculate start time
-            end_time = datetime.now()
-            start_time = end_time - timedelta(days=days)
+            cache_key = f"binance:klines:BTCUSDT:1d:{days}"
+            klines = await self._cache_get(cache_key)
+            if klines is None:
+                # Calculate the time window in epoch milliseconds
+                end_ms = time.time_ns() // 1_000_000
+                start_ms = end_ms - days * 86_400_000
+                
+                # Use public API endpoint
+                params = {
+                    **self._klines_params,
+                    "startTime": start_ms,
+                    "endTime": end_ms,
+                    "limit": days
+                }
+                klines = await self._get_json(self._klines_path, params)
+                logger.debug("Fetched price history from public API")
+                await self._cache_set(cache_key, klines, CACHE_TTL_HISTORY_SHORT)
             
-            # Use public API endpoint
-            url = f"{self.base_url}/api/v3/klines"
-            params = {
-                "symbol": "BTCUSDT",
-                "interval": "1d",
-                "startTime": int(start_time.timestamp() * 1000),
-                "endTime": int(end_time.timestamp() * 1000),
-                "limit": days
-            }
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            klines = response.json()
-            logger.info("Fetched price history from public API")
+            # Format the data (kline rows are [open_time, open, high, low, close, volume, ...])
+            price_data = [
+                Kline(
+                    datetime.fromtimestamp(open_time / 1000),
+                    float(open_price),
+                    float(high),
+                    float(low),
+                    float(close),
+                    float(volume)
+                )
+                for open_time, open_price, high, low, close, volume, *_ in klines
+            ]
             
-            # Format the data
-            price_data = []
-            for kline in klines:
-                price_data.append({
-                    "timestamp": datetime.fromtimestamp(kline[0] / 1000),
-                    "open": float(kline[1]),
-                    "high": float(kline[2]),
-                    "low": float(kline[3]),
-                    "close": float(kline[4]),
-                    "volume": float(kline[5])
-                })
-            
-            logger.info(f"Fetched {len(price_data)} days of BTC price data")
+            logger.info("Fetched %d days of BTC price data", len(price_data))
             return price_data
             
         except Exception as e:
@@ -79,14 +295,19 @@ class BinanceHandler:
     
     async def get_current_btc_price(self) -> float:
         """Get the current BTC price using public API."""
+        return await self._cached(("price", "BTCUSDT"), CACHE_TTL_PRICE, self._fetch_current_btc_price,
+                                  redis_backed=True)
+    
+    async def _fetch_current_btc_price(self) -> float:
+        """Download the latest BTC price from the public API."""
         try:
-            # Use public API endpoint
-            url = f"{self.base_url}/api/v3/ticker/price"
-            params = {"symbol": "BTCUSDT"}
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            logger.info("Fetched BTC price from public API")
+            cache_key = "binance:price:BTCUSDT"
+            data = await self._cache_get(cache_key)
+            if data is None:
+                # Use public API endpoint
+                data = await self._get_json(self._price_path, self._price_params)
+                logger.debug("Fetched BTC price from public API")
+                await self._cache_set(cache_key, data, CACHE_TTL_PRICE)
             return float(data["price"])
         except Exception as e:
             logger.error(f"Error fetching current price: {e}")
@@ -94,6 +315,11 @@ class BinanceHandler:
     
     async def get_account_balance(self) -> Dict[str, float]:
         """Get account balance for BTC and USDT - returns demo data since we're using public API only."""
+        # Shared briefly so the BTC and USDT balance lookups of one request use a single fetch
+        return await self._cached(("account",), CACHE_TTL_BALANCE, self._fetch_account_balance)
+    
+    async def _fetch_account_balance(self) -> Dict[str, float]:
+        """Load account balances."""
         logger.info("Using public API - returning demo balance data for testing")
         # Return demo data for testing without API keys
         return {
@@ -126,20 +352,21 @@ class BinanceHandler:
     async def get_portfolio_value_usdt(self) -> Dict[str, float]:
         """Get total portfolio value in USDT."""
         try:
-            # Get current balances
-            btc_balance = await self.get_btc_balance()
-            usdt_balance = await self.get_usdt_balance()
-            
-            # Get current BTC price
-            btc_price = await self.get_current_btc_price()
+            # Get current balances and BTC price concurrently
+            btc_balance, usdt_balance, btc_price = await asyncio.gather(
+                self.get_btc_balance(),
+                self.get_usdt_balance(),
+                self.get_current_btc_price()
+            )
             
             # Calculate values
             btc_value_usdt = btc_balance * btc_price
             total_value = btc_value_usdt + usdt_balance
             
             # Calculate allocations
-            btc_allocation = (btc_value_usdt / total_value * 100) if total_value > 0 else 0
-            usdt_allocation = (usdt_balance / total_value * 100) if total_value > 0 else 0
+            percent_per_usdt = 100.0 / total_value if total_value > 0 else 0.0
+            btc_allocation = btc_value_usdt * percent_per_usdt
+            usdt_allocation = usdt_balance * percent_per_usdt
             
             return {
                 "btc_balance": btc_balance,
@@ -158,8 +385,10 @@ class BinanceHandler:
     async def get_btc_buying_power(self) -> Dict[str, float]:
         """Calculate how much BTC can be bought with current USDT."""
         try:
-            usdt_balance = await self.get_usdt_balance()
-            btc_price = await self.get_current_btc_price()
+            usdt_balance, btc_price = await asyncio.gather(
+                self.get_usdt_balance(),
+                self.get_current_btc_price()
+            )
             
             # Calculate buying power (reserve small amount for fees)
             usable_usdt = usdt_balance * 0.999  # Reserve 0.1% for fees
@@ -234,12 +463,12 @@ class BinanceHandler:
             "quantity": amount
         }
     
-    def format_price_data_for_llm(self, price_data: List[Dict[str, Any]]) -> str:
+    def format_price_data_for_llm(self, price_data: List[Kline]) -> str:
         """
         Format price data for LLM consumption.
         
         Args:
-            price_data: List of price data dictionaries
+            price_data: List of Kline rows
             
         Returns:
             Formatted string for LLM analysis
@@ -247,199 +476,40 @@ class BinanceHandler:
         if not price_data:
             return "No price data available"
         
-        formatted = "BTC Price History (Last 15 days):\n"
-        formatted += "Date | Open | High | Low | Close | Volume\n"
-        formatted += "-" * 50 + "\n"
+        # Collect lines and join once instead of growing a string
+        lines = [
+            "BTC Price History (Last 15 days):",
+            "Date | Open | High | Low | Close | Volume",
+            "-" * 50
+        ]
         
         for data in price_data[-15:]:  # Last 15 days
-            formatted += (
-                f"{data['timestamp'].strftime('%Y-%m-%d')} | "
-                f"${data['open']:.2f} | "
-                f"${data['high']:.2f} | "
-                f"${data['low']:.2f} | "
-                f"${data['close']:.2f} | "
-                f"{data['volume']:.2f}\n"
+            lines.append(
+                f"{data.timestamp.date().isoformat()} | "
+                f"${data.open:.2f} | "
+                f"${data.high:.2f} | "
+                f"${data.low:.2f} | "
+                f"${data.close:.2f} | "
+                f"{data.volume:.2f}"
             )
         
         # Add basic statistics
-        closes = [d['close'] for d in price_data]
-        if len(closes) > 1:
-            price_change = closes[-1] - closes[0]
-            price_change_pct = (price_change / closes[0]) * 100
-            formatted += f"\nPeriod Change: ${price_change:.2f} ({price_change_pct:.2f}%)\n"
-            formatted += f"Highest: ${max(d['high'] for d in price_data):.2f}\n"
-            formatted += f"Lowest: ${min(d['low'] for d in price_data):.2f}\n"
-        
-        return formatted
-
-
-async def main():
-    """
-    Test all Binance handler endpoints to verify they work with public API.
-    """
-    print("🚀 Testing Binance Handler with Public API")
-    print("=" * 60)
-    
-    try:
-        # Import config here to avoid circular imports
-        from .config import load_config
-        
-        # Initialize handler
-        config = load_config()
-        handler = BinanceHandler(config)
-        
-        print(f"📡 API Access: {handler.has_api_access}")
-        print(f"🌐 Base URL: {handler.base_url}")
-        print()
-        
-        # Test 1: Current BTC Price
-        print("1️⃣ Testing get_current_btc_price()...")
-        try:
-            price = await handler.get_current_btc_price()
-            print(f"   ✅ Current BTC Price: ${price:,.2f}")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 2: Price History
-        print("2️⃣ Testing fetch_btc_price_history()...")
-        try:
-            history = await handler.fetch_btc_price_history(7)  # Last 7 days
-            print(f"   ✅ Fetched {len(history)} days of price data")
-            if history:
-                latest = history[-1]
-                print(f"   📅 Latest: {latest['timestamp'].strftime('%Y-%m-%d')} - Close: ${latest['close']:.2f}")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 3: Account Balance (Demo)
-        print("3️⃣ Testing get_account_balance()...")
-        try:
-            balance = await handler.get_account_balance()
-            print(f"   ✅ Demo Balance:")
-            for asset, data in balance.items():
-                total = data['free'] + data['locked']
-                print(f"      {asset}: {total:.6f} (Free: {data['free']:.6f}, Locked: {data['locked']:.6f})")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 4: USDT Balance
-        print("4️⃣ Testing get_usdt_balance()...")
-        try:
-            usdt = await handler.get_usdt_balance()
-            print(f"   ✅ USDT Balance: {usdt:.2f} USDT")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 5: BTC Balance
-        print("5️⃣ Testing get_btc_balance()...")
-        try:
-            btc = await handler.get_btc_balance()
-            print(f"   ✅ BTC Balance: {btc:.6f} BTC")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 6: Portfolio Value
-        print("6️⃣ Testing get_portfolio_value_usdt()...")
-        try:
-            portfolio = await handler.get_portfolio_value_usdt()
-            print(f"   ✅ Portfolio Summary:")
-            print(f"      BTC Holdings: {portfolio['btc_balance']:.6f} BTC")
-            print(f"      BTC Price: ${portfolio['btc_price']:,.2f}")
-            print(f"      BTC Value: ${portfolio['btc_value_usdt']:,.2f} USDT")
-            print(f"      USDT Balance: ${portfolio['usdt_balance']:,.2f} USDT")
-            print(f"      Total Value: ${portfolio['total_value_usdt']:,.2f} USDT")
-            print(f"      BTC Allocation: {portfolio['btc_allocation_percent']:.1f}%")
-            print(f"      USDT Allocation: {portfolio['usdt_allocation_percent']:.1f}%")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 7: Buying Power
-        print("7️⃣ Testing get_btc_buying_power()...")
-        try:
-            buying_power = await handler.get_btc_buying_power()
-            print(f"   ✅ Buying Power Analysis:")
-            print(f"      USDT Balance: {buying_power['usdt_balance']:.2f} USDT")
-            print(f"      BTC Price: ${buying_power['btc_price']:,.2f}")
-            print(f"      Usable USDT (after fees): {buying_power['usable_usdt']:.2f} USDT")
-            print(f"      Max BTC Buyable: {buying_power['max_btc_buyable']:.6f} BTC")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 8: Trade Simulation
-        print("8️⃣ Testing execute_trade() (simulated)...")
-        try:
-            from .schemas import TradingAnalysis
-            
-            # Create a mock trading analysis
-            mock_analysis = TradingAnalysis(
-                intention="buy",
-                analysis="Test market analysis for simulation",
-                suggested_action="Buy 0.001 BTC for testing",
-                amount=0.001,
-                confidence=0.8,
-                risk_level="medium"
-            )
+        if len(price_data) > 1:
+            # Track the extremes in a single pass over the rows
+            highest = price_data[0].high
+            lowest = price_data[0].low
+            for data in price_data:
+                if data.high > highest:
+                    highest = data.high
+                if data.low < lowest:
+                    lowest = data.low
             
-            result = await handler.execute_trade(mock_analysis)
-            print(f"   ✅ Trade Simulation Result:")
-            print(f"      Status: {result['status']}")
-            print(f"      Message: {result['message']}")
-            print(f"      Action: {result['action']}")
-            print(f"      Amount: {result['amount']} BTC")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 9: Buy Order Simulation
-        print("9️⃣ Testing place_buy_order() (simulated)...")
-        try:
-            buy_result = await handler.place_buy_order("BTCUSDT", 0.001)
-            print(f"   ✅ Buy Order Simulation:")
-            print(f"      Status: {buy_result['status']}")
-            print(f"      Message: {buy_result['message']}")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 10: Sell Order Simulation
-        print("🔟 Testing place_sell_order() (simulated)...")
-        try:
-            sell_result = await handler.place_sell_order("BTCUSDT", 0.001)
-            print(f"   ✅ Sell Order Simulation:")
-            print(f"      Status: {sell_result['status']}")
-            print(f"      Message: {sell_result['message']}")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
+            first_close = price_data[0].close
+            price_change = price_data[-1].close - first_close
+            price_change_pct = (price_change / first_close) * 100
+            lines.append("")
+            lines.append(f"Period Change: ${price_change:.2f} ({price_change_pct:.2f}%)")
+            lines.append(f"Highest: ${highest:.2f}")
+            lines.append(f"Lowest: ${lowest:.2f}")
         
-        # Test 11: Format Price Data for LLM
-        print("1️⃣1️⃣ Testing format_price_data_for_llm()...")
-        try:
-            history = await handler.fetch_btc_price_history(5)  # Last 5 days
-            formatted = handler.format_price_data_for_llm(history)
-            print(f"   ✅ Formatted price data for LLM:")
-            print("   " + "\n   ".join(formatted.split("\n")[:10]))  # Show first 10 lines
-            print("   ... (truncated)")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        print("🎉 All endpoint tests completed!")
-        print("=" * 60)
-        
-    except Exception as e:
-        print(f"❌ Fatal error during testing: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+        return "\n".join(lines) + "\n"
@@ -4,14 +4,17 @@ Handles environment variables and security settings.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class Config(BaseModel):
     """Configuration settings for the trading bot."""
     
+    # Loaded once at startup and never mutated afterwards
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     # Telegram settings
     telegram_bot_token: str
     telegram_chat_id: str
@@ -37,14 +40,19 @@ class Config(BaseModel):
     gemini_api_key: str = ""
     gemini_model: str = "gemini-pro"
     
+    # LLM request settings
+    llm_max_concurrency: int = 4
+    llm_timeout: float = 120.0
+    # Skip a requested premium AI comparison when the standard analysis is at least this confident
+    premium_escalation_threshold: Optional[float] = None
+    
     # Trading settings
     default_trade_amount: float = 0.001
     price_analysis_days: int = 15
     enable_trading: bool = False
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # Optional Redis URL for a market data cache shared between bot processes
+    redis_url: Optional[str] = None
     
     @field_validator('telegram_bot_token')
     @classmethod
@@ -63,8 +71,12 @@ class Config(BaseModel):
         return v
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment variables."""
+    """Load configuration from environment variables (read once and reused)."""
+    # Only needed when actually loading, so importing Config stays cheap
+    from dotenv import load_dotenv
+    
     load_dotenv()
     
     # Create config with environment variables
@@ -82,9 +94,13 @@ def load_config() -> Config:
         'openai_model': os.getenv('OPENAI_MODEL', 'gpt-4'),
         'gemini_api_key': os.getenv('GEMINI_API_KEY', ''),
         'gemini_model': os.getenv('GEMINI_MODEL', 'gemini-pro'),
+        'llm_max_concurrency': int(os.getenv('LLM_MAX_CONCURRENCY', '4')),
+        'llm_timeout': float(os.getenv('LLM_TIMEOUT', '120')),
+        'premium_escalation_threshold': float(os.getenv('PREMIUM_ESCALATION_THRESHOLD')) if os.getenv('PREMIUM_ESCALATION_THRESHOLD') else None,
         'default_trade_amount': float(os.getenv('DEFAULT_TRADE_AMOUNT', '0.001')),
         'price_analysis_days': int(os.getenv('PRICE_ANALYSIS_DAYS', '15')),
         'enable_trading': os.getenv('ENABLE_TRADING', 'false').lower() == 'true',
+        'redis_url': os.getenv('REDIS_URL') or None,
     }
     
     return Config(**config_data)
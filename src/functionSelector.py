@@ -3,63 +3,368 @@ Function Selector module.
 Analyzes user intent and returns the appropriate function to execute.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Callable, Any, Dict
+import re
+import time
+from functools import cached_property, wraps
+from typing import Awaitable, Callable, Any, Dict, NamedTuple, Optional, Tuple
 from .ai_factory import AIFactory
 from .binance_handler import BinanceHandler
 from .config import Config
 from .schemas import IntentClassification, TradingAnalysis
-from .prompts import (
-    get_btc_price_info_prompt, 
-    get_usdt_balance_info_prompt, 
-    get_portfolio_value_prompt,
-    get_market_analysis_prompt,
-    get_risk_assessment_prompt,
-    get_trading_decision_prompt,
-    get_volatile_market_prompt,
-    get_portfolio_analysis_prompt,
-    get_error_recovery_prompt
-)
+from .prompts import get_sentiment_analysis_prompt
 
 logger = logging.getLogger(__name__)
 
+# Exact-match LLM response cache lifetimes (seconds) and maximum entries per cache
+INTENT_CACHE_TTL = 300
+ANALYSIS_CACHE_TTL = 60
+LLM_CACHE_SIZE = 256
+# Number of formatted price histories kept for reuse across handlers
+FORMAT_CACHE_SIZE = 8
+# History windows (days) read by the price info and news sentiment handlers
+PRICE_INFO_DAYS = 3
+NEWS_CONTEXT_DAYS = 7
+
+# Messages likely to need market data, which is then prefetched during intent classification
+MARKET_DATA_HINT = re.compile(
+    r"\b(btc|bitcoin|price|market|buy|sell|trad\w*|portfolio|risk|analy[sz]\w*|trend|volatil\w*)\b",
+    re.IGNORECASE
+)
+
+# Phrases that route a message straight to news sentiment analysis, matched in one scan
+NEWS_KEYWORDS = re.compile("|".join(map(re.escape, [
+    "news sentiment", "sentiment analysis", "news of btc", "news about bitcoin",
+    "crypto news", "bitcoin news", "btc news", "market news", "latest news",
+    "news affecting", "news impact", "social media sentiment", "news mood"
+])), re.IGNORECASE)
+
+# Premium AI providers a user can ask for by name
+PREMIUM_PROVIDERS = re.compile(r"\b(openai|gemini)\b", re.IGNORECASE)
+
+# Display names and per-request cost notices for the premium providers
+PREMIUM_PROVIDER_LABELS = {
+    "openai": "OpenAI GPT-4",
+    "gemini": "Google Gemini"
+}
+PREMIUM_COST_ESTIMATES = {
+    "openai": "~$0.01-0.03",
+    "gemini": "~$0.005-0.015"
+}
+
+# Unambiguous commands and short questions routed without asking the LLM:
+# (pattern, intent, prompt function)
+FAST_INTENTS = [
+    (re.compile(r"^/price\b|^(what('?s| is) (the )?(current )?)?(btc|bitcoin) price\??$", re.IGNORECASE),
+     "btc_price_info", "get_btc_price_info_prompt"),
+    (re.compile(r"^/(balance|usdt)\b|^(how much usdt do i have|what('?s| is) my (usdt )?balance)\??$", re.IGNORECASE),
+     "usdt_balance_info", "get_usdt_balance_info_prompt"),
+    (re.compile(r"^/portfolio\b|^(what('?s| is)|how much is) my portfolio (worth|value)\??$", re.IGNORECASE),
+     "portfolio_value", "get_portfolio_value_prompt"),
+    (re.compile(r"^/help\b", re.IGNORECASE), "general_consult", "none")
+]
+
+# Static response texts, built once at import
+GENERAL_CONSULT_MESSAGE = """🤖 Crypto Trading Bot Help:
+
+Available Functions:
+• 📈 Price Information - Get current BTC prices
+• 💰 Balance Checking - Check USDT balance and buying power  
+• 📊 Portfolio Analysis - View total portfolio value
+• 🎯 Market Analysis - Get AI-powered market insights
+• ⚠️ Risk Assessment - Evaluate trading risks
+• 🔄 Trading Decisions - Get trading recommendations
+
+Commands:
+/price, /balance, /usdt, /portfolio, /status, /ai, /help
+
+💬 Natural Language: Just ask questions like:
+"What's BTC price?", "Should I buy?", "How's my portfolio?"
+
+⚠️ Note: All trades require your explicit confirmation!"""
+
+UNCLEAR_REQUEST_MESSAGE = """❓ I didn't quite understand your request.
+
+Please try:
+• Being more specific with your question
+• Using commands like /help, /price, /balance
+• Asking direct questions like:
+  - "What's the current BTC price?"
+  - "How much USDT do I have?"
+  - "Should I buy Bitcoin now?"
+  - "What's my portfolio worth?"
+
+Type /help for more information."""
+
+ERROR_RECOVERY_TAIL = """
+
+Please try:
+• Being more specific with your request
+• Using simpler language
+• Trying a command like /help, /price, or /balance
+• Asking direct questions like "What's BTC price?" or "How much USDT do I have?"
+
+The bot understands:
+📈 Price queries, 💰 Balance questions, 📊 Portfolio requests, 🎯 Trading advice"""
+
+# Characters that break Telegram Markdown parsing in model output, and their safe stand-ins
+TELEGRAM_ESCAPE = str.maketrans({
+    '*': '•',
+    '_': '-',
+    '[': '(',
+    ']': ')',
+    '`': "'",
+    '~': '-'
+})
+
+# Replies for intents whose features are not available yet
+COMING_SOON_MESSAGES = {
+    "price_alerts": "🔔 Price alerts feature coming soon! This will allow you to set intelligent price notifications with technical analysis.",
+    "trade_history": "📊 Trade history and performance analytics coming soon! This will track your trading performance and provide insights.",
+    "stop_loss_management": "🛡️ Stop loss management tools coming soon! This will help you set proper risk management levels.",
+    "dca_strategy": "💰 Dollar Cost Averaging (DCA) strategy tools coming soon! This will help you set up systematic investment plans.",
+    "multi_timeframe": "⏱️ Multi-timeframe analysis coming soon! This will analyze 1H, 4H, 1D, and 1W charts for comprehensive insights."
+}
+
+# Message layouts for account data responses, filled via format_map
+USDT_BALANCE_TEMPLATE = """💰 USDT Balance Information:
+  💵 Total USDT: {usdt_balance:.2f} USDT
+  📈 Current BTC Price: ${btc_price:,.2f}
+  🔢 Usable USDT (after fees): {usable_usdt:.2f}
+  ₿ Max BTC Buyable: {max_btc_buyable:.6f} BTC"""
+
+PORTFOLIO_VALUE_TEMPLATE = """📊 Portfolio Summary:
+  ₿ BTC Holdings: {btc_balance:.6f} BTC
+  📈 BTC Price: ${btc_price:,.2f}
+  💰 BTC Value: ${btc_value_usdt:,.2f} USDT
+  💵 USDT Balance: ${usdt_balance:,.2f} USDT
+  """ + "=" * 40 + """
+  🏦 Total Portfolio: ${total_value_usdt:,.2f} USDT
+  📊 BTC Allocation: {btc_allocation_percent:.1f}%
+  📊 USDT Allocation: {usdt_allocation_percent:.1f}%"""
+
+# Message layouts for AI analysis responses, filled via format_map
+RISK_ASSESSMENT_TEMPLATE = """⚠️ Risk Assessment:
+📊 Analysis: {analysis}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk Level: {risk_level}
+💡 Recommendation: {suggested_action}"""
+
+TRADING_DECISION_TEMPLATE = """🎯 Trading Decision:
+📊 Analysis: {analysis}
+💡 Recommendation: {suggested_action}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk Level: {risk_level}{trade_action}"""
+
+VOLATILE_MARKET_TEMPLATE = """🌪️ Volatile Market Analysis:
+📊 Analysis: {analysis}
+💡 Conservative Recommendation: {suggested_action}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk Level: {risk_level}
+⚠️ Note: Extra caution recommended during volatile periods"""
+
+PORTFOLIO_ANALYSIS_TEMPLATE = """📊 Portfolio Analysis:
+Current Allocation:
+  🏦 Total Value: ${total_value_usdt:,.2f} USDT
+  ₿ BTC: {btc_allocation_percent:.1f}% (${btc_value_usdt:,.2f})
+  💵 USDT: {usdt_allocation_percent:.1f}% (${usdt_balance:,.2f})
+
+Market-Based Recommendation:
+📊 Analysis: {analysis}
+💡 Suggestion: {suggested_action}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk Level: {risk_level}"""
+
+NEWS_SENTIMENT_TEMPLATE = """📰 News & Sentiment Analysis:
+🌐 Social Sentiment: {social_sentiment}
+📰 Recent News: {news_data}
+😨😍 Fear/Greed Index: {fear_greed_index}
+
+📊 AI Analysis: {analysis}
+💡 Recommendation: {suggested_action}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk Level: {risk_level}
+
+💡 Note: News sentiment analysis combines social media buzz, major headlines, and market psychology indicators."""
+
+TECHNICAL_ANALYSIS_TEMPLATE = """📊 Technical Analysis:
+📈 Technical Analysis: {analysis}
+💡 Recommendation: {suggested_action}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk Level: {risk_level}
+
+📋 Note: Analysis includes price trends, support/resistance levels, volume patterns, and momentum indicators."""
+
+STANDARD_ANALYSIS_TEMPLATE = """🎯 {title}:
+📊 Analysis: {analysis}
+💡 Recommendation: {suggested_action}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk Level: {risk_level}"""
+
+# Premium comparison message: one section per provider, then the comparison summary
+COMPARISON_TEMPLATE = """🤖 AI Comparison Analysis - {title}
+
+{ollama}
+
+{premium}
+
+🔍 Comparison Summary:"""
+
+COMPARISON_SECTION_TEMPLATE = """{header}
+📊 Recommendation: {suggested_action}
+🎯 Confidence: {confidence:.1%}
+⚠️ Risk: {risk_level}
+💭 Analysis: {analysis}"""
+
+
+def _detect_provider(user_message: str) -> str:
+    """Return the premium provider named in the message ("openai" wins over "gemini"), or "none"."""
+    named = {name.lower() for name in PREMIUM_PROVIDERS.findall(user_message)}
+    if "openai" in named:
+        return "openai"
+    return "gemini" if "gemini" in named else "none"
+
+
+class AnalysisSpec(NamedTuple):
+    """How _handle_analysis serves one analysis intent."""
+    template: str
+    days: Optional[int]  # History window, None for the configured default
+    premium: bool  # Offers a premium AI comparison
+    confirm: bool  # Asks for trade confirmation
+    action: str  # What failed, for the user-facing error message
+
+
+def _handler_errors(subject: str, action: str):
+    """
+    Turn exceptions raised by an intent handler into an error response.
+    
+    Args:
+        subject: What the handler deals with, for the log line
+        action: What failed, for the user-facing message
+    """
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(self, *args, **kwargs) -> Dict[str, Any]:
+            try:
+                return await handler(self, *args, **kwargs)
+            except Exception as e:
+                logger.error("Error handling %s: %s", subject, e)
+                return {
+                    "response_type": "error",
+                    "message": f"❌ Error {action}: {e}",
+                    "success": False
+                }
+        return wrapper
+    return decorator
+
 
 class FunctionSelector:
     """Selects and executes the appropriate function based on user intent."""
     
+    # Map intents to the names of their handler methods (shared by all instances)
+    _INTENT_HANDLERS: Dict[str, str] = {
+        "btc_price_info": "_handle_btc_price_info",
+        "usdt_balance_info": "_handle_usdt_balance_info",
+        "portfolio_value": "_handle_portfolio_value",
+        "market_analysis": "_handle_analysis",
+        "risk_assessment": "_handle_analysis",
+        "trading_decision": "_handle_analysis",
+        "volatile_market": "_handle_analysis",
+        "portfolio_analysis": "_handle_portfolio_analysis",
+        "general_consult": "_handle_general_consult",
+        "error_recovery": "_handle_error_recovery",
+        "price_alerts": "_handle_coming_soon",
+        "trade_history": "_handle_coming_soon",
+        "technical_analysis": "_handle_analysis",
+        "news_sentiment": "_handle_news_sentiment",
+        "stop_loss_management": "_handle_coming_soon",
+        "dca_strategy": "_handle_coming_soon",
+        "multi_timeframe": "_handle_coming_soon",
+        "educational_mode": "_handle_educational_mode"
+    }
+    
+    # Analysis intents served by _handle_analysis
+    _ANALYSIS_INTENTS: Dict[str, AnalysisSpec] = {
+        "market_analysis": AnalysisSpec(STANDARD_ANALYSIS_TEMPLATE, None, True, True, "processing market analysis"),
+        "risk_assessment": AnalysisSpec(RISK_ASSESSMENT_TEMPLATE, None, False, False, "processing risk assessment"),
+        "trading_decision": AnalysisSpec(TRADING_DECISION_TEMPLATE, None, True, True, "processing trading decision"),
+        "volatile_market": AnalysisSpec(VOLATILE_MARKET_TEMPLATE, 7, False, False, "analyzing volatile market"),
+        "technical_analysis": AnalysisSpec(TECHNICAL_ANALYSIS_TEMPLATE, None, True, True, "processing technical analysis")
+    }
+    
     def __init__(self, config: Config, binance: BinanceHandler, ai_handler):
         """Initialize the function selector."""
         self.config = config
         self.binance = binance
         self.intent_ai_handler = ai_handler  # Always Ollama for intent classification
-        
-        # Create separate AI handler for analysis (can be different provider)
-        self.analysis_ai_handler = AIFactory.create_analysis_handler(config)
+        # Appended to account data messages
+        self._testnet_suffix = "\n  ℹ️ This is testnet data" if config.binance_testnet else ""
         
         logger.info(f"Intent classification AI: {config.ai_provider}")
         logger.info(f"Trading analysis AI: {config.analysis_ai_provider}")
         
-        # Map intents to their corresponding functions
-        self.intent_function_map = {
-            "btc_price_info": self._handle_btc_price_info,
-            "usdt_balance_info": self._handle_usdt_balance_info,
-            "portfolio_value": self._handle_portfolio_value,
-            "market_analysis": self._handle_market_analysis,
-            "risk_assessment": self._handle_risk_assessment,
-            "trading_decision": self._handle_trading_decision,
-            "volatile_market": self._handle_volatile_market,
-            "portfolio_analysis": self._handle_portfolio_analysis,
-            "general_consult": self._handle_general_consult,
-            "error_recovery": self._handle_error_recovery,
-            "price_alerts": self._handle_price_alerts,
-            "trade_history": self._handle_trade_history,
-            "technical_analysis": self._handle_technical_analysis,
-            "news_sentiment": self._handle_news_sentiment,
-            "stop_loss_management": self._handle_stop_loss_management,
-            "dca_strategy": self._handle_dca_strategy,
-            "multi_timeframe": self._handle_multi_timeframe,
-            "educational_mode": self._handle_educational_mode
-        }
+        # Recent LLM responses: key -> (stored_at, value)
+        self._intent_cache: Dict[str, Tuple[float, IntentClassification]] = {}
+        self._analysis_cache: Dict[str, Tuple[float, TradingAnalysis]] = {}
+        # Formatted price history keyed on (days, rows, last candle)
+        self._format_cache: Dict[Tuple, str] = {}
+        # Bound concurrent LLM requests so bursts queue instead of overloading providers
+        self._llm_semaphore = asyncio.Semaphore(config.llm_max_concurrency)
+        
+        # Strong references to fire-and-forget prefetch tasks
+        self._background_tasks: set = set()
+        # Every distinct history window a handler may read, so the prefetch hits whichever runs
+        self._prefetch_days = tuple(sorted({
+            config.price_analysis_days, PRICE_INFO_DAYS, NEWS_CONTEXT_DAYS,
+            *(spec.days for spec in self._ANALYSIS_INTENTS.values() if spec.days)
+        }))
+        # LLM requests in flight, shared by concurrent callers asking the same thing
+        self._llm_inflight: Dict[Tuple[int, str], asyncio.Task] = {}
+        self._warmed = False
+    
+    @cached_property
+    def analysis_ai_handler(self):
+        """Separate AI handler for analysis (can be a different provider), built on first use."""
+        return AIFactory.create_analysis_handler(self.config)
+    
+    def warmup(self):
+        """
+        Start loading the local Ollama model in the background so the first user
+        message does not wait for it. Paid providers are never warmed up.
+        """
+        if self._warmed:
+            return
+        self._warmed = True
+        
+        # Intent and analysis share one Ollama handler and model, so one request warms both
+        if self.config.ai_provider.lower() == "ollama":
+            request = self.intent_ai_handler.classify_user_intent("warmup")
+        elif self.config.analysis_ai_provider.lower() == "ollama":
+            request = self.analysis_ai_handler.analyze_market_data("warmup", "empty")
+        else:
+            return
+        
+        task = asyncio.create_task(self._warmup(request))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _warmup(self, request: Awaitable[Any]):
+        """Send the warmup request, logging instead of raising when it fails."""
+        logger.info("Warming up Ollama model...")
+        try:
+            await self._call_llm(request)
+        except Exception as e:
+            logger.warning(f"AI warmup request failed: {e}")
+    
+    async def close(self):
+        """Cancel outstanding prefetches and LLM requests so they do not outlive the shared sessions."""
+        pending = [*self._background_tasks, *self._llm_inflight.values()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def process_user_request(self, user_message: str) -> Dict[str, Any]:
         """
@@ -73,37 +378,42 @@ class FunctionSelector:
         """
         try:
             # Quick manual override for news sentiment (expanded keywords)
-            news_keywords = [
-                "news sentiment", "sentiment analysis", "news of btc", "news about bitcoin", 
-                "crypto news", "bitcoin news", "btc news", "market news", "latest news",
-                "news affecting", "news impact", "social media sentiment", "news mood"
-            ]
-            
-            if any(keyword in user_message.lower() for keyword in news_keywords):
-                logger.info(f"Manual override: News sentiment detected in '{user_message}'")
-                # Create a mock intent
-                class MockIntent:
-                    intent = "news_sentiment"
-                    confidence = 0.95
-                    reasoning = "Manual override for news sentiment - detected news keywords"
-                    suggested_prompt_function = "get_news_sentiment_prompt"
-                    required_data = ["news", "sentiment"]
-                    user_query_type = "analysis"
-                    premium_ai_requested = "openai" in user_message.lower() or "gemini" in user_message.lower()
-                    requested_ai_provider = "openai" if "openai" in user_message.lower() else ("gemini" if "gemini" in user_message.lower() else "none")
-                    comparison_analysis = False
+            if NEWS_KEYWORDS.search(user_message):
+                logger.info("Manual override: News sentiment detected in '%s'", user_message)
+                provider = _detect_provider(user_message)
+                intent = IntentClassification(
+                    intent="news_sentiment",
+                    confidence=0.95,
+                    reasoning="Manual override for news sentiment - detected news keywords",
+                    suggested_prompt_function="get_news_sentiment_prompt",
+                    required_data=["news", "sentiment"],
+                    user_query_type="analysis",
+                    premium_ai_requested=provider != "none",
+                    requested_ai_provider=provider
+                )
                 
-                return await self._handle_news_sentiment(user_message, MockIntent())
-            
-            # Classify the user's intent
-            logger.info(f"Classifying intent for: {user_message[:50]}...")
-            # Use intent AI handler (always Ollama) for classification
-            intent = await self.intent_ai_handler.classify_user_intent(user_message)
+                return await self._handle_news_sentiment(user_message, intent)
+            
+            # Route obvious commands directly, otherwise ask the LLM
+            intent = self._match_fast_intent(user_message)
+            if intent is None:
+                # Start loading market data while the LLM classifies the intent
+                if MARKET_DATA_HINT.search(user_message):
+                    self._prefetch_market_data()
+                
+                # Classify the user's intent
+                logger.info("Classifying intent for: %.50s...", user_message)
+                # Use intent AI handler (always Ollama) for classification
+                intent = await self._classify_intent(user_message)
             
-            logger.info(f"Classified intent: {intent.intent} (confidence: {intent.confidence:.2f})")
+            logger.info("Classified intent: %s (confidence: %.2f)", intent.intent, intent.confidence)
             
             # Get the appropriate function
-            handler_function = self.intent_function_map.get(intent.intent, self._handle_error_recovery)
+            try:
+                handler_name = self._INTENT_HANDLERS[intent.intent]
+            except KeyError:
+                handler_name = "_handle_error_recovery"
+            handler_function = getattr(self, handler_name)
             
             # Execute the function
             result = await handler_function(user_message, intent)
@@ -113,424 +423,342 @@ class FunctionSelector:
                 "intent": intent.intent,
                 "confidence": intent.confidence,
                 "reasoning": intent.reasoning,
-                "function_used": handler_function.__name__
+                "function_used": handler_name
             }
             
             return result
             
         except Exception as e:
-            logger.error(f"Error in function selector: {e}")
+            logger.error("Error in function selector: %s", e)
             return await self._handle_error_recovery(user_message, None, str(e))
     
+    @staticmethod
+    def _cache_lookup(cache: Dict[str, Tuple[float, Any]], key: str, ttl: float) -> Optional[Any]:
+        """Return a cached value if present and fresh, dropping it once expired."""
+        hit = cache.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        del cache[key]
+        return None
+    
+    @staticmethod
+    def _cache_store(cache: Dict[str, Tuple[float, Any]], key: str, value: Any):
+        """Store a value, evicting the oldest entry when the cache is full."""
+        if len(cache) >= LLM_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (time.monotonic(), value)
+    
+    async def _cached_llm(self, cache: Dict[str, Tuple[float, Any]], key: str, ttl: float,
+                          request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached LLM response for key, or send the request built by request().
+        
+        Concurrent callers for the same key share one in-flight request and get its
+        result or error.
+        """
+        value = self._cache_lookup(cache, key, ttl)
+        if value is not None:
+            return value
+        
+        # Intent and analysis keys live in different caches, so scope in-flight keys per cache
+        inflight_key = (id(cache), key)
+        task = self._llm_inflight.get(inflight_key)
+        if task is None:
+            def store(done: asyncio.Task):
+                self._llm_inflight.pop(inflight_key, None)
+                if not done.cancelled() and done.exception() is None:
+                    self._cache_store(cache, key, done.result())
+            
+            task = asyncio.create_task(self._call_llm(request()))
+            self._llm_inflight[inflight_key] = task
+            task.add_done_callback(store)
+        
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _call_llm(self, request: Awaitable[Any]) -> Any:
+        """Run an LLM request under the shared concurrency limit and timeout."""
+        async with self._llm_semaphore:
+            try:
+                return await asyncio.wait_for(request, self.config.llm_timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"AI request timed out after {self.config.llm_timeout:g}s")
+    
+    @staticmethod
+    def _match_fast_intent(user_message: str) -> Optional[IntentClassification]:
+        """Classify slash commands and trivial questions locally, or return None."""
+        text = user_message.strip()
+        # Messages naming a premium provider need the LLM to pick up the premium request
+        if PREMIUM_PROVIDERS.search(text):
+            return None
+        for pattern, intent_name, prompt_function in FAST_INTENTS:
+            if pattern.search(text):
+                return IntentClassification(
+                    intent=intent_name,
+                    confidence=0.99,
+                    reasoning="Keyword match",
+                    suggested_prompt_function=prompt_function,
+                    required_data=[],
+                    user_query_type="information"
+                )
+        return None
+    
+    async def _classify_intent(self, user_message: str) -> IntentClassification:
+        """Classify the user's intent, reusing the result for repeated messages."""
+        key = " ".join(user_message.lower().split())
+        return await self._cached_llm(
+            self._intent_cache, key, INTENT_CACHE_TTL,
+            lambda: self.intent_ai_handler.classify_user_intent(user_message)
+        )
+    
+    async def _analyze(self, user_message: str, formatted_data: str, provider: Optional[str] = None) -> TradingAnalysis:
+        """
+        Run market analysis, reusing the result for the same question on the same data.
+        
+        Args:
+            user_message: The user's message
+            formatted_data: Price history formatted for the LLM
+            provider: Premium provider to ask instead of the analysis AI handler
+        """
+        key = hashlib.blake2b(f"{provider}\0{user_message}\0{formatted_data}".encode(), digest_size=16).hexdigest()
+        
+        def request() -> Awaitable[TradingAnalysis]:
+            if provider is None:
+                handler = self.analysis_ai_handler
+            else:
+                handler = AIFactory.create_premium_handler(self.config, provider)
+            return handler.analyze_market_data(user_message, formatted_data)
+        
+        return await self._cached_llm(self._analysis_cache, key, ANALYSIS_CACHE_TTL, request)
+    
+    async def _get_formatted_history(self, days: int) -> str:
+        """Fetch BTC price history and format it for the LLM, reusing the text while the data is unchanged."""
+        price_data = await self.binance.fetch_btc_price_history(days)
+        key = (days, len(price_data), price_data[-1] if price_data else None)
+        formatted = self._format_cache.get(key)
+        if formatted is None:
+            formatted = self.binance.format_price_data_for_llm(price_data)
+            if len(self._format_cache) >= FORMAT_CACHE_SIZE:
+                del self._format_cache[next(iter(self._format_cache))]
+            self._format_cache[key] = formatted
+        return formatted
+    
+    def _prefetch_market_data(self):
+        """Warm the price history caches in the background for the handler that follows."""
+        # Failures are logged by the Binance handler and retried by the real request
+        prefetch = asyncio.gather(
+            *(self._get_formatted_history(days) for days in self._prefetch_days),
+            return_exceptions=True
+        )
+        self._background_tasks.add(prefetch)
+        prefetch.add_done_callback(self._background_tasks.discard)
+    
+    @staticmethod
+    def _comparison_section(header: str, analysis: TradingAnalysis) -> str:
+        """One provider's block of a premium comparison message."""
+        summary = analysis.analysis[:200]
+        return COMPARISON_SECTION_TEMPLATE.format_map({
+            "header": header,
+            "suggested_action": analysis.suggested_action,
+            "confidence": analysis.confidence,
+            "risk_level": analysis.risk_level.upper(),
+            "analysis": summary + ("..." if len(analysis.analysis) > 200 else "")
+        })
+    
+    @staticmethod
+    def _analysis_fields(analysis: TradingAnalysis) -> Dict[str, Any]:
+        """Template fields shared by all analysis messages."""
+        return {
+            "analysis": analysis.analysis,
+            "suggested_action": analysis.suggested_action,
+            "confidence": analysis.confidence,
+            "risk_level": analysis.risk_level.upper()
+        }
+    
+    @_handler_errors("BTC price info", "fetching BTC price")
     async def _handle_btc_price_info(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
         """Handle BTC price information requests."""
-        try:
-            # Get current BTC price
-            current_price = await self.binance.get_current_btc_price()
-            
-            # Get recent price history for context
-            price_data = await self.binance.fetch_btc_price_history(3)  # Last 3 days
-            formatted_history = self.binance.format_price_data_for_llm(price_data)
-            
-            return {
-                "response_type": "btc_price_info",
-                "data": {
-                    "current_price": current_price,
-                    "price_history": formatted_history
-                },
-                "message": f"₿ Current BTC Price: ${current_price:,.2f}",
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling BTC price info: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error fetching BTC price: {e}",
-                "success": False
-            }
+        # Get current BTC price and recent price history for context concurrently
+        current_price, formatted_history = await asyncio.gather(
+            self.binance.get_current_btc_price(),
+            self._get_formatted_history(PRICE_INFO_DAYS)
+        )
+        
+        return {
+            "response_type": "btc_price_info",
+            "data": {
+                "current_price": current_price,
+                "price_history": formatted_history
+            },
+            "message": f"₿ Current BTC Price: ${current_price:,.2f}",
+            "success": True
+        }
     
+    @_handler_errors("USDT balance info", "fetching USDT balance")
     async def _handle_usdt_balance_info(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
         """Handle USDT balance and buying power requests."""
-        try:
-            # Get USDT balance
-            usdt_balance = await self.binance.get_usdt_balance()
-            
-            # Get buying power
-            buying_power = await self.binance.get_btc_buying_power()
-            
-            message = f"""💰 USDT Balance Information:
-  💵 Total USDT: {usdt_balance:.2f} USDT
-  📈 Current BTC Price: ${buying_power['btc_price']:,.2f}
-  🔢 Usable USDT (after fees): {buying_power['usable_usdt']:.2f}
-  ₿ Max BTC Buyable: {buying_power['max_btc_buyable']:.6f} BTC"""
-            
-            if self.config.binance_testnet:
-                message += "\n  ℹ️ This is testnet data"
-            
-            return {
-                "response_type": "usdt_balance_info",
-                "data": {
-                    "usdt_balance": usdt_balance,
-                    "buying_power": buying_power
-                },
-                "message": message,
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling USDT balance info: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error fetching USDT balance: {e}",
-                "success": False
-            }
+        # Get USDT balance and buying power concurrently
+        usdt_balance, buying_power = await asyncio.gather(
+            self.binance.get_usdt_balance(),
+            self.binance.get_btc_buying_power()
+        )
+        
+        message = USDT_BALANCE_TEMPLATE.format_map({**buying_power, "usdt_balance": usdt_balance})
+        message += self._testnet_suffix
+        
+        return {
+            "response_type": "usdt_balance_info",
+            "data": {
+                "usdt_balance": usdt_balance,
+                "buying_power": buying_power
+            },
+            "message": message,
+            "success": True
+        }
     
+    @_handler_errors("portfolio value", "calculating portfolio value")
     async def _handle_portfolio_value(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
         """Handle portfolio value requests."""
-        try:
-            # Get portfolio information
-            portfolio = await self.binance.get_portfolio_value_usdt()
-            
-            message = f"""📊 Portfolio Summary:
-  ₿ BTC Holdings: {portfolio['btc_balance']:.6f} BTC
-  📈 BTC Price: ${portfolio['btc_price']:,.2f}
-  💰 BTC Value: ${portfolio['btc_value_usdt']:,.2f} USDT
-  💵 USDT Balance: ${portfolio['usdt_balance']:,.2f} USDT
-  {"="*40}
-  🏦 Total Portfolio: ${portfolio['total_value_usdt']:,.2f} USDT
-  📊 BTC Allocation: {portfolio['btc_allocation_percent']:.1f}%
-  📊 USDT Allocation: {portfolio['usdt_allocation_percent']:.1f}%"""
-            
-            if self.config.binance_testnet:
-                message += "\n  ℹ️ This is testnet data"
-            
-            return {
-                "response_type": "portfolio_value",
-                "data": portfolio,
-                "message": message,
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling portfolio value: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error calculating portfolio value: {e}",
-                "success": False
-            }
+        # Get portfolio information
+        portfolio = await self.binance.get_portfolio_value_usdt()
+        
+        message = PORTFOLIO_VALUE_TEMPLATE.format_map(portfolio)
+        message += self._testnet_suffix
+        
+        return {
+            "response_type": "portfolio_value",
+            "data": portfolio,
+            "message": message,
+            "success": True
+        }
     
-    async def _handle_market_analysis(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle market analysis requests."""
+    async def _handle_analysis(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
+        """Handle the market-data analysis intents listed in _ANALYSIS_INTENTS."""
+        spec = self._ANALYSIS_INTENTS[intent.intent]
         try:
             # Fetch price data
-            price_data = await self.binance.fetch_btc_price_history(self.config.price_analysis_days)
-            formatted_data = self.binance.format_price_data_for_llm(price_data)
+            formatted_data = await self._get_formatted_history(spec.days or self.config.price_analysis_days)
             
             # Check if premium AI comparison is requested
-            if intent.premium_ai_requested and intent.requested_ai_provider in ["openai", "gemini"]:
-                return await self._handle_premium_ai_comparison(user_message, formatted_data, intent, "market_analysis")
-            
-            # Standard analysis (Ollama only)
-            return await self._get_standard_analysis(user_message, formatted_data, "market_analysis")
-            
-        except Exception as e:
-            logger.error(f"Error handling market analysis: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error processing market analysis: {e}",
-                "success": False
-            }
-    
-    async def _handle_risk_assessment(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle risk assessment requests."""
-        try:
-            # Get current market data
-            price_data = await self.binance.fetch_btc_price_history(self.config.price_analysis_days)
-            formatted_data = self.binance.format_price_data_for_llm(price_data)
-            
-            # Analyze for risk - use market analysis for now
-            analysis = await self.analysis_ai_handler.analyze_market_data(user_message, formatted_data)
-            
-            message = f"""⚠️ Risk Assessment:
-📊 Analysis: {analysis.analysis}
-🎯 Confidence: {analysis.confidence:.1%}
-⚠️ Risk Level: {analysis.risk_level.upper()}
-💡 Recommendation: {analysis.suggested_action}"""
-            
-            return {
-                "response_type": "risk_assessment",
-                "data": analysis,
-                "message": message,
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling risk assessment: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error processing risk assessment: {e}",
-                "success": False
-            }
-    
-    async def _handle_trading_decision(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle trading decision requests."""
-        try:
-            # Get market data and portfolio info
-            price_data = await self.binance.fetch_btc_price_history(self.config.price_analysis_days)
-            formatted_data = self.binance.format_price_data_for_llm(price_data)
-            
-            # Check if premium AI was requested
-            if intent.premium_ai_requested and intent.requested_ai_provider != "none":
-                return await self._handle_premium_ai_comparison(
-                    user_message, formatted_data, intent, "trading_decision"
-                )
+            if spec.premium and intent.premium_ai_requested and intent.requested_ai_provider != "none":
+                return await self._handle_premium_ai_comparison(user_message, formatted_data, intent, intent.intent)
             
             # Standard analysis with configured AI
-            analysis = await self.analysis_ai_handler.analyze_market_data(user_message, formatted_data)
-            
-            message = f"""🎯 Trading Decision:
-📊 Analysis: {analysis.analysis}
-💡 Recommendation: {analysis.suggested_action}
-🎯 Confidence: {analysis.confidence:.1%}
-⚠️ Risk Level: {analysis.risk_level.upper()}"""
+            analysis = await self._analyze(user_message, formatted_data)
+            trade_suggested = analysis.intention in ["buy", "sell"] and analysis.amount > 0
             
-            if analysis.intention in ["buy", "sell"] and analysis.amount > 0:
-                message += f"\n🔄 Suggested Action: {analysis.intention.upper()} {analysis.amount} BTC"
+            message = spec.template.format_map({
+                **self._analysis_fields(analysis),
+                "title": intent.intent.replace('_', ' ').title(),
+                "trade_action": f"\n🔄 Suggested Action: {analysis.intention.upper()} {analysis.amount} BTC" if trade_suggested else ""
+            })
             
-            return {
-                "response_type": "trading_decision",
-                "data": analysis,
-                "message": message,
-                "success": True,
-                "requires_trade_confirmation": analysis.intention in ["buy", "sell"] and analysis.amount > 0
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling trading decision: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error processing trading decision: {e}",
-                "success": False
-            }
-    
-    async def _handle_volatile_market(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle volatile market concerns."""
-        try:
-            # Get recent price data to assess volatility
-            price_data = await self.binance.fetch_btc_price_history(7)  # Last week
-            formatted_data = self.binance.format_price_data_for_llm(price_data)
-            
-            # Analyze with conservative approach
-            analysis = await self.analysis_ai_handler.analyze_market_data(user_message, formatted_data)
-            
-            message = f"""🌪️ Volatile Market Analysis:
-📊 Analysis: {analysis.analysis}
-💡 Conservative Recommendation: {analysis.suggested_action}
-🎯 Confidence: {analysis.confidence:.1%}
-⚠️ Risk Level: {analysis.risk_level.upper()}
-⚠️ Note: Extra caution recommended during volatile periods"""
-            
-            return {
-                "response_type": "volatile_market",
+            result = {
+                "response_type": intent.intent,
                 "data": analysis,
                 "message": message,
                 "success": True
             }
+            if spec.confirm:
+                result["requires_trade_confirmation"] = trade_suggested
+            return result
             
         except Exception as e:
-            logger.error(f"Error handling volatile market: {e}")
+            logger.error("Error handling %s: %s", intent.intent.replace('_', ' '), e)
             return {
                 "response_type": "error",
-                "message": f"❌ Error analyzing volatile market: {e}",
+                "message": f"❌ Error {spec.action}: {e}",
                 "success": False
             }
     
+    @_handler_errors("portfolio analysis", "analyzing portfolio")
     async def _handle_portfolio_analysis(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
         """Handle portfolio analysis and rebalancing requests."""
-        try:
-            # Get current portfolio
-            portfolio = await self.binance.get_portfolio_value_usdt()
-            
-            # Get market data for context
-            price_data = await self.binance.fetch_btc_price_history(self.config.price_analysis_days)
-            formatted_data = self.binance.format_price_data_for_llm(price_data)
-            
-            # Analyze portfolio with market context
-            analysis = await self.analysis_ai_handler.analyze_market_data(user_message, formatted_data)
-            
-            message = f"""📊 Portfolio Analysis:
-Current Allocation:
-  🏦 Total Value: ${portfolio['total_value_usdt']:,.2f} USDT
-  ₿ BTC: {portfolio['btc_allocation_percent']:.1f}% (${portfolio['btc_value_usdt']:,.2f})
-  💵 USDT: {portfolio['usdt_allocation_percent']:.1f}% (${portfolio['usdt_balance']:,.2f})
-
-Market-Based Recommendation:
-📊 Analysis: {analysis.analysis}
-💡 Suggestion: {analysis.suggested_action}
-🎯 Confidence: {analysis.confidence:.1%}
-⚠️ Risk Level: {analysis.risk_level.upper()}"""
-            
-            return {
-                "response_type": "portfolio_analysis",
-                "data": {
-                    "portfolio": portfolio,
-                    "analysis": analysis
-                },
-                "message": message,
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling portfolio analysis: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error analyzing portfolio: {e}",
-                "success": False
-            }
+        # Get current portfolio and market data for context concurrently
+        portfolio, formatted_data = await asyncio.gather(
+            self.binance.get_portfolio_value_usdt(),
+            self._get_formatted_history(self.config.price_analysis_days)
+        )
+        
+        # Analyze portfolio with market context
+        analysis = await self._analyze(user_message, formatted_data)
+        
+        message = PORTFOLIO_ANALYSIS_TEMPLATE.format_map({**portfolio, **self._analysis_fields(analysis)})
+        
+        return {
+            "response_type": "portfolio_analysis",
+            "data": {
+                "portfolio": portfolio,
+                "analysis": analysis
+            },
+            "message": message,
+            "success": True
+        }
     
     async def _handle_general_consult(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
         """Handle general consultation requests."""
-        try:
-            # Simple informational response
-            message = """🤖 Crypto Trading Bot Help:
-
-Available Functions:
-• 📈 Price Information - Get current BTC prices
-• 💰 Balance Checking - Check USDT balance and buying power  
-• 📊 Portfolio Analysis - View total portfolio value
-• 🎯 Market Analysis - Get AI-powered market insights
-• ⚠️ Risk Assessment - Evaluate trading risks
-• 🔄 Trading Decisions - Get trading recommendations
-
-Commands:
-/price, /balance, /usdt, /portfolio, /status, /ai, /help
-
-💬 Natural Language: Just ask questions like:
-"What's BTC price?", "Should I buy?", "How's my portfolio?"
-
-⚠️ Note: All trades require your explicit confirmation!"""
-            
-            return {
-                "response_type": "general_consult",
-                "data": {},
-                "message": message,
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling general consult: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error in general consultation: {e}",
-                "success": False
-            }
+        # Simple informational response
+        return {
+            "response_type": "general_consult",
+            "data": {},
+            "message": GENERAL_CONSULT_MESSAGE,
+            "success": True
+        }
     
+    @_handler_errors("news sentiment", "processing news sentiment analysis")
     async def _handle_news_sentiment(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
         """Handle news sentiment analysis requests."""
-        try:
-            # Get market data for context
-            price_data = await self.binance.fetch_btc_price_history(7)  # Last week for context
-            formatted_data = self.binance.format_price_data_for_llm(price_data)
-            
-            # Mock news and sentiment data (in production, integrate with news APIs)
-            mock_social_sentiment = "Neutral to slightly bullish sentiment on social media. Bitcoin discussions show cautious optimism."
-            mock_news_data = "Recent news: Major institutions continue Bitcoin adoption, regulatory clarity improving, ETF approvals ongoing."
-            mock_fear_greed = "Fear & Greed Index: 52 (Neutral) - Market showing balanced sentiment between fear and greed."
-            
-            # Check if premium AI comparison is requested
-            if intent.premium_ai_requested and intent.requested_ai_provider in ["openai", "gemini"]:
-                return await self._handle_premium_ai_comparison(user_message, formatted_data, intent, "news_sentiment")
-            
-            # Standard sentiment analysis
-            from .prompts import get_sentiment_analysis_prompt
-            prompt = get_sentiment_analysis_prompt(
-                social_sentiment=mock_social_sentiment,
-                news_data=mock_news_data,
-                fear_greed_index=mock_fear_greed,
-                technical_data=formatted_data,
-                user_query=user_message
-            )
-            
-            analysis = await self.analysis_ai_handler.analyze_market_data(user_message, prompt)
-            
-            message = f"""📰 News & Sentiment Analysis:
-🌐 Social Sentiment: {mock_social_sentiment}
-📰 Recent News: {mock_news_data}
-😨😍 Fear/Greed Index: {mock_fear_greed}
-
-📊 AI Analysis: {analysis.analysis}
-💡 Recommendation: {analysis.suggested_action}
-🎯 Confidence: {analysis.confidence:.1%}
-⚠️ Risk Level: {analysis.risk_level.upper()}
-
-💡 Note: News sentiment analysis combines social media buzz, major headlines, and market psychology indicators."""
-            
-            return {
-                "response_type": "news_sentiment",
-                "data": analysis,
-                "message": message,
-                "success": True,
-                "requires_trade_confirmation": analysis.intention in ["buy", "sell"] and analysis.amount > 0
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling news sentiment: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error processing news sentiment analysis: {e}",
-                "success": False
-            }
-    
-    async def _handle_technical_analysis(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle technical analysis requests."""
-        try:
-            # Get price data for technical analysis
-            price_data = await self.binance.fetch_btc_price_history(self.config.price_analysis_days)
-            formatted_data = self.binance.format_price_data_for_llm(price_data)
-            
-            # Check if premium AI comparison is requested
-            if intent.premium_ai_requested and intent.requested_ai_provider in ["openai", "gemini"]:
-                return await self._handle_premium_ai_comparison(user_message, formatted_data, intent, "technical_analysis")
-            
-            # Standard technical analysis
-            analysis = await self.analysis_ai_handler.analyze_market_data(user_message, formatted_data)
-            
-            message = f"""📊 Technical Analysis:
-📈 Technical Analysis: {analysis.analysis}
-💡 Recommendation: {analysis.suggested_action}
-🎯 Confidence: {analysis.confidence:.1%}
-⚠️ Risk Level: {analysis.risk_level.upper()}
-
-📋 Note: Analysis includes price trends, support/resistance levels, volume patterns, and momentum indicators."""
-            
-            return {
-                "response_type": "technical_analysis",
-                "data": analysis,
-                "message": message,
-                "success": True,
-                "requires_trade_confirmation": analysis.intention in ["buy", "sell"] and analysis.amount > 0
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling technical analysis: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error processing technical analysis: {e}",
-                "success": False
-            }
+        # Get market data for context
+        formatted_data = await self._get_formatted_history(NEWS_CONTEXT_DAYS)
+        
+        # Mock news and sentiment data (in production, integrate with news APIs)
+        mock_social_sentiment = "Neutral to slightly bullish sentiment on social media. Bitcoin discussions show cautious optimism."
+        mock_news_data = "Recent news: Major institutions continue Bitcoin adoption, regulatory clarity improving, ETF approvals ongoing."
+        mock_fear_greed = "Fear & Greed Index: 52 (Neutral) - Market showing balanced sentiment between fear and greed."
+        
+        # Check if premium AI comparison is requested
+        if intent.premium_ai_requested and intent.requested_ai_provider in ["openai", "gemini"]:
+            return await self._handle_premium_ai_comparison(user_message, formatted_data, intent, "news_sentiment")
+        
+        # Standard sentiment analysis
+        prompt = get_sentiment_analysis_prompt(
+            social_sentiment=mock_social_sentiment,
+            news_data=mock_news_data,
+            fear_greed_index=mock_fear_greed,
+            technical_data=formatted_data,
+            user_query=user_message
+        )
+        
+        analysis = await self._analyze(user_message, prompt)
+        
+        message = NEWS_SENTIMENT_TEMPLATE.format_map({
+            **self._analysis_fields(analysis),
+            "social_sentiment": mock_social_sentiment,
+            "news_data": mock_news_data,
+            "fear_greed_index": mock_fear_greed
+        })
+        
+        return {
+            "response_type": "news_sentiment",
+            "data": analysis,
+            "message": message,
+            "success": True,
+            "requires_trade_confirmation": analysis.intention in ["buy", "sell"] and analysis.amount > 0
+        }
     
+    @_handler_errors("educational mode", "processing educational request")
     async def _handle_educational_mode(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
         """Handle educational content requests."""
-        try:
-            # Check if premium AI comparison is requested
-            if intent.premium_ai_requested and intent.requested_ai_provider in ["openai", "gemini"]:
-                # For educational content, use a simplified version of the data
-                educational_data = "Educational content about cryptocurrency trading concepts"
-                return await self._handle_premium_ai_comparison(user_message, educational_data, intent, "educational_mode")
-            
-            # Standard educational response
-            message = f"""🎓 Crypto Trading Education:
+        # Check if premium AI comparison is requested
+        if intent.premium_ai_requested and intent.requested_ai_provider in ["openai", "gemini"]:
+            # For educational content, use a simplified version of the data
+            educational_data = "Educational content about cryptocurrency trading concepts"
+            return await self._handle_premium_ai_comparison(user_message, educational_data, intent, "educational_mode")
+        
+        # Standard educational response
+        message = f"""🎓 Crypto Trading Education:
 
 📚 Your Question: {user_message}
 
@@ -555,177 +783,83 @@ Commands:
 • Keep learning about market analysis
 
 💡 Use commands like "RSI analysis" or "What is DCA?" for specific topics."""
-            
-            # Create a basic educational analysis response
-            from .schemas import TradingAnalysis
-            educational_analysis = TradingAnalysis(
-                intention="education",
-                analysis=f"Educational response about: {user_message}",
-                suggested_action="Continue learning about crypto trading fundamentals",
-                confidence=1.0,
-                risk_level="low"
-            )
-            
-            return {
-                "response_type": "educational_mode",
-                "data": educational_analysis,
-                "message": message,
-                "success": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error handling educational mode: {e}")
-            return {
-                "response_type": "error",
-                "message": f"❌ Error processing educational request: {e}",
-                "success": False
-            }
-    
-    # Placeholder handlers for other new intents
-    async def _handle_price_alerts(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle price alert requests."""
-        return {
-            "response_type": "price_alerts",
-            "data": {},
-            "message": "🔔 Price alerts feature coming soon! This will allow you to set intelligent price notifications with technical analysis.",
-            "success": True
-        }
-    
-    async def _handle_trade_history(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle trade history requests."""
-        return {
-            "response_type": "trade_history", 
-            "data": {},
-            "message": "📊 Trade history and performance analytics coming soon! This will track your trading performance and provide insights.",
-            "success": True
-        }
-    
-    async def _handle_stop_loss_management(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle stop loss management requests."""
+        
+        # Create a basic educational analysis response
+        educational_analysis = TradingAnalysis(
+            intention="education",
+            analysis=f"Educational response about: {user_message}",
+            suggested_action="Continue learning about crypto trading fundamentals",
+            confidence=1.0,
+            risk_level="low"
+        )
+        
         return {
-            "response_type": "stop_loss_management",
-            "data": {},
-            "message": "🛡️ Stop loss management tools coming soon! This will help you set proper risk management levels.",
+            "response_type": "educational_mode",
+            "data": educational_analysis,
+            "message": message,
             "success": True
         }
     
-    async def _handle_dca_strategy(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle DCA strategy requests."""
+    async def _handle_coming_soon(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
+        """Handle intents whose features are not available yet (see COMING_SOON_MESSAGES)."""
         return {
-            "response_type": "dca_strategy",
+            "response_type": intent.intent,
             "data": {},
-            "message": "💰 Dollar Cost Averaging (DCA) strategy tools coming soon! This will help you set up systematic investment plans.",
+            "message": COMING_SOON_MESSAGES[intent.intent],
             "success": True
         }
     
-    async def _handle_multi_timeframe(self, user_message: str, intent: IntentClassification) -> Dict[str, Any]:
-        """Handle multi-timeframe analysis requests."""
+    async def _handle_error_recovery(self, user_message: str, intent: IntentClassification, error_msg: str = None) -> Dict[str, Any]:
+        """Handle error recovery and unclear requests."""
+        if error_msg:
+            message = f"❌ Error Processing Request:\n{error_msg}" + ERROR_RECOVERY_TAIL
+        else:
+            message = UNCLEAR_REQUEST_MESSAGE
+        
         return {
-            "response_type": "multi_timeframe",
+            "response_type": "error_recovery",
             "data": {},
-            "message": "⏱️ Multi-timeframe analysis coming soon! This will analyze 1H, 4H, 1D, and 1W charts for comprehensive insights.",
-            "success": True
+            "message": message,
+            "success": False
         }
     
-    async def _handle_error_recovery(self, user_message: str, intent: IntentClassification, error_msg: str = None) -> Dict[str, Any]:
-        """Handle error recovery and unclear requests."""
-        try:
-            if error_msg:
-                message = f"""❌ Error Processing Request:
-{error_msg}
-
-Please try:
-• Being more specific with your request
-• Using simpler language
-• Trying a command like /help, /price, or /balance
-• Asking direct questions like "What's BTC price?" or "How much USDT do I have?"
-
-The bot understands:
-📈 Price queries, 💰 Balance questions, 📊 Portfolio requests, 🎯 Trading advice"""
-            else:
-                message = """❓ I didn't quite understand your request.
-
-Please try:
-• Being more specific with your question
-• Using commands like /help, /price, /balance
-• Asking direct questions like:
-  - "What's the current BTC price?"
-  - "How much USDT do I have?"
-  - "Should I buy Bitcoin now?"
-  - "What's my portfolio worth?"
-
-Type /help for more information."""
-            
-            return {
-                "response_type": "error_recovery",
-                "data": {},
-                "message": message,
-                "success": False
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in error recovery: {e}")
-            return {
-                "response_type": "critical_error",
-                "data": {},
-                "message": "❌ Critical error occurred. Please restart the bot.",
-                "success": False
-            }
-    
     async def _handle_premium_ai_comparison(self, user_message: str, formatted_data: str, intent: IntentClassification, analysis_type: str) -> Dict[str, Any]:
         """Handle premium AI comparison analysis."""
         try:
-            # Create premium AI handler based on requested provider
-            if intent.requested_ai_provider == "openai":
-                from .openai_handler import OpenAIHandler
-                premium_handler = OpenAIHandler(self.config)
-                provider_name = "OpenAI GPT-4"
-            elif intent.requested_ai_provider == "gemini":
-                from .gemini_handler import GeminiHandler
-                premium_handler = GeminiHandler(self.config)
-                provider_name = "Google Gemini"
-            else:
+            provider_name = PREMIUM_PROVIDER_LABELS.get(intent.requested_ai_provider)
+            if provider_name is None:
                 # Fallback to standard analysis
                 return await self._get_standard_analysis(user_message, formatted_data, analysis_type)
             
-            # Get both analyses in parallel
-            import asyncio
-            ollama_task = self.analysis_ai_handler.analyze_market_data(user_message, formatted_data)
-            premium_task = premium_handler.analyze_market_data(user_message, formatted_data)
-            
-            ollama_analysis, premium_analysis = await asyncio.gather(ollama_task, premium_task)
-            
-            # Helper function to escape special characters for Telegram
-            def escape_telegram_text(text: str) -> str:
-                """Escape special characters that can cause Telegram parsing issues."""
-                # Remove or replace problematic characters
-                text = text.replace('*', '•')  # Replace asterisks with bullets
-                text = text.replace('_', '-')  # Replace underscores with dashes
-                text = text.replace('[', '(')  # Replace square brackets
-                text = text.replace(']', ')')
-                text = text.replace('`', "'")  # Replace backticks with quotes
-                text = text.replace('~', '-')  # Replace tildes
-                return text
-            
-            # Format comparison message with safe text
-            safe_ollama_analysis = escape_telegram_text(ollama_analysis.analysis[:200])
-            safe_premium_analysis = escape_telegram_text(premium_analysis.analysis[:200])
-            
-            message = f"""🤖 AI Comparison Analysis - {analysis_type.replace('_', ' ').title()}
-
-📱 Ollama (Free) Analysis:
-📊 Recommendation: {escape_telegram_text(ollama_analysis.suggested_action)}
-🎯 Confidence: {ollama_analysis.confidence:.1%}
-⚠️ Risk: {ollama_analysis.risk_level.upper()}
-💭 Analysis: {safe_ollama_analysis}{'...' if len(ollama_analysis.analysis) > 200 else ''}
-
-🧠 {provider_name} (Premium) Analysis:
-📊 Recommendation: {escape_telegram_text(premium_analysis.suggested_action)}
-🎯 Confidence: {premium_analysis.confidence:.1%}
-⚠️ Risk: {premium_analysis.risk_level.upper()}
-💭 Analysis: {safe_premium_analysis}{'...' if len(premium_analysis.analysis) > 200 else ''}
-
-🔍 Comparison Summary:"""
+            threshold = self.config.premium_escalation_threshold
+            if threshold is not None:
+                # Only pay for the premium model when the standard analysis is unsure
+                ollama_analysis = await self._analyze(user_message, formatted_data)
+                if ollama_analysis.confidence >= threshold:
+                    result = await self._get_standard_analysis(user_message, formatted_data, analysis_type)
+                    result["message"] += (f"\n\nℹ️ {provider_name} comparison skipped: standard analysis "
+                                          f"confidence {ollama_analysis.confidence:.1%} meets the {threshold:.0%} threshold")
+                    return result
+                premium_analysis = await self._analyze(user_message, formatted_data, intent.requested_ai_provider)
+            else:
+                # Get both analyses in parallel
+                ollama_task = self._analyze(user_message, formatted_data)
+                premium_task = self._analyze(user_message, formatted_data, intent.requested_ai_provider)
+                
+                # Let both finish so a premium failure falls back to the cached standard analysis
+                # instead of requesting it again while the first call is still running
+                ollama_analysis, premium_analysis = await asyncio.gather(ollama_task, premium_task, return_exceptions=True)
+                for result in (ollama_analysis, premium_analysis):
+                    if isinstance(result, Exception):
+                        raise result
+            
+            # Format comparison message, escaping model text for Telegram in one pass
+            # (the template itself contains none of the escaped characters)
+            message = COMPARISON_TEMPLATE.format_map({
+                "title": analysis_type.replace('_', ' ').title(),
+                "ollama": self._comparison_section("📱 Ollama (Free) Analysis:", ollama_analysis),
+                "premium": self._comparison_section(f"🧠 {provider_name} (Premium) Analysis:", premium_analysis)
+            }).translate(TELEGRAM_ESCAPE)
             
             # Compare the results
             if ollama_analysis.intention == premium_analysis.intention:
@@ -744,7 +878,7 @@ Type /help for more information."""
                 comparison_result = "conflict"
             
             # Add cost notice
-            cost_estimate = "~$0.01-0.03" if intent.requested_ai_provider == "openai" else "~$0.005-0.015"
+            cost_estimate = PREMIUM_COST_ESTIMATES[intent.requested_ai_provider]
             message += f"\n\n💰 Premium AI usage cost: {cost_estimate}"
             
             # Determine which analysis to use for trading decisions
@@ -777,19 +911,18 @@ Type /help for more information."""
             }
             
         except Exception as e:
-            logger.error(f"Error in premium AI comparison: {e}")
+            logger.error("Error in premium AI comparison: %s", e)
             # Fallback to standard analysis
             return await self._get_standard_analysis(user_message, formatted_data, analysis_type)
     
     async def _get_standard_analysis(self, user_message: str, formatted_data: str, analysis_type: str) -> Dict[str, Any]:
         """Get standard analysis as fallback."""
-        analysis = await self.analysis_ai_handler.analyze_market_data(user_message, formatted_data)
+        analysis = await self._analyze(user_message, formatted_data)
         
-        message = f"""🎯 {analysis_type.replace('_', ' ').title()}:
-📊 Analysis: {analysis.analysis}
-💡 Recommendation: {analysis.suggested_action}
-🎯 Confidence: {analysis.confidence:.1%}
-⚠️ Risk Level: {analysis.risk_level.upper()}"""
+        message = STANDARD_ANALYSIS_TEMPLATE.format_map({
+            **self._analysis_fields(analysis),
+            "title": analysis_type.replace('_', ' ').title()
+        })
         
         return {
             "response_type": analysis_type,
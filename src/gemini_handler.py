@@ -6,11 +6,11 @@ Handles communication with Google Gemini API for trade analysis.
 import json
 import logging
 from typing import Dict, Any, Optional
-import asyncio
 import google.generativeai as genai
 from .config import Config
 from .schemas import TradingAnalysis
 from .prompts import SYSTEM_PROMPT, get_market_analysis_prompt
+from .utils import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,11 @@ class GeminiHandler:
         self.config = config
         genai.configure(api_key=config.gemini_api_key)
         self.model = genai.GenerativeModel(config.gemini_model)
+        # Generation settings are the same for every analysis request
+        self.generation_config = genai.types.GenerationConfig(
+            temperature=0.3,
+            max_output_tokens=1000,
+        )
     
     async def analyze_market_data(self, user_message: str, price_data: str) -> TradingAnalysis:
         """
@@ -59,17 +64,10 @@ class GeminiHandler:
     async def _call_gemini(self, prompt: str) -> str:
         """Make API request to Gemini."""
         try:
-            # Run in thread pool since Gemini client is not async
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, 
-                lambda: self.model.generate_content(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.3,
-                        max_output_tokens=1000,
-                    )
-                )
+            # Native async call on the model's long-lived client, no executor thread hop
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=self.generation_config
             )
             
             return response.text or ""
@@ -81,28 +79,14 @@ class GeminiHandler:
     def _parse_gemini_response(self, response: str) -> TradingAnalysis:
         """Parse Gemini's JSON response into TradingAnalysis object."""
         try:
-            # Clean the response - remove markdown code blocks and extra content
-            response = response.strip()
-            
-            # Remove markdown code block markers
-            if response.startswith('```json'):
-                response = response[7:]  # Remove ```json
-            if response.startswith('```'):
-                response = response[3:]   # Remove ```
-            if response.endswith('```'):
-                response = response[:-3]  # Remove trailing ```
-            
-            response = response.strip()
-            
-            # Find JSON content between braces
+            # Take the JSON object between the outer braces, which also skips markdown code fences
             start_idx = response.find('{')
             end_idx = response.rfind('}') + 1
             
             if start_idx == -1 or end_idx == 0:
                 raise ValueError("No valid JSON found in response")
             
-            json_str = response[start_idx:end_idx]
-            data = json.loads(json_str)
+            data = json_loads(response[start_idx:end_idx])
             
             # Extract analysis text - handle both string and nested object formats
             analysis_text = data.get("analysis", "Analysis unavailable")
@@ -173,11 +157,9 @@ class GeminiHandler:
         """Check if Gemini API is accessible."""
         try:
             # Simple test call to check API connectivity
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content("Hello", 
-                    generation_config=genai.types.GenerationConfig(max_output_tokens=1))
+            await self.model.generate_content_async(
+                "Hello",
+                generation_config=genai.types.GenerationConfig(max_output_tokens=1)
             )
             return True
                     
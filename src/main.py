@@ -5,12 +5,15 @@ Orchestrates the trading bot components.
 
 import asyncio
 import logging
+import os
 import signal
 import sys
+import threading
 from .config import load_config
 from .binance_handler import BinanceHandler
 from .ai_factory import AIFactory
 from .functionSelector import FunctionSelector
+from .utils import install_uvloop
 
 # Set up logging
 logging.basicConfig(
@@ -24,6 +27,29 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Console banner, written in one go on startup and /help
+WELCOME_BANNER = (
+    "\n" + "=" * 60 + "\n"
+    "🤖 CRYPTO TRADING BOT - CONSOLE MODE\n"
+    + "=" * 60 + "\n"
+    "💡 Commands:\n"
+    "   /help     - Show help\n"
+    "   /quit     - Exit bot\n"
+    "\n"
+    "💬 Ask me anything:\n"
+    "   'What's the current BTC price?'\n"
+    "   'How much USDT do I have?'\n"
+    "   'What's my portfolio worth?'\n"
+    "   'Should I buy Bitcoin now?'\n"
+    "   'What's the market trend?'\n"
+    "   '/status' - System status\n"
+    "   '/ai' - AI provider status\n"
+    "   '/test' - Test intent classification\n"
+    + "=" * 60 + "\n"
+    "⚠️  Note: All trades require your confirmation!\n"
+    + "=" * 60 + "\n\n"
+)
+
 
 class TradingBotApp:
     """Main application class."""
@@ -35,6 +61,8 @@ class TradingBotApp:
         self.ai_handler = None
         self.function_selector = None
         self.running = False
+        # Set by SIGINT/SIGTERM to end the console loop
+        self._stop_event = asyncio.Event()
     
     async def start(self):
         """Start the trading bot application."""
@@ -48,10 +76,11 @@ class TradingBotApp:
             self.binance = BinanceHandler(self.config)
             self.ai_handler = AIFactory.create_handler(self.config)
             self.function_selector = FunctionSelector(self.config, self.binance, self.ai_handler)
+            self.function_selector.warmup()
             
             # Start console interface
             logger.info("Starting console interface...")
-            await self._show_welcome()
+            self._show_welcome()
             await self._console_loop()
             
         except Exception as e:
@@ -63,38 +92,39 @@ class TradingBotApp:
         """Stop the trading bot application."""
         logger.info("Shutting down trading bot...")
         self.running = False
+        
+        if self.function_selector:
+            await self.function_selector.close()
+        if self.binance:
+            await self.binance.close()
+        
         logger.info("Trading bot stopped.")
     
-    async def _show_welcome(self):
+    def _show_welcome(self):
         """Show welcome message."""
-        print("\n" + "="*60)
-        print("🤖 CRYPTO TRADING BOT - CONSOLE MODE")
-        print("="*60)
-        print("💡 Commands:")
-        print("   /help     - Show help")
-        print("   /quit     - Exit bot")
-        print("")
-        print("💬 Ask me anything:")
-        print("   'What's the current BTC price?'")
-        print("   'How much USDT do I have?'")
-        print("   'What's my portfolio worth?'")
-        print("   'Should I buy Bitcoin now?'")
-        print("   'What's the market trend?'")
-        print("   '/status' - System status")
-        print("   '/ai' - AI provider status")
-        print("   '/test' - Test intent classification")
-        print("="*60)
-        print("⚠️  Note: All trades require your confirmation!")
-        print("="*60 + "\n")
+        sys.stdout.write(WELCOME_BANNER)
+        sys.stdout.flush()
     
     async def _console_loop(self):
         """Main console interaction loop."""
         self.running = True
+        lines = self._start_stdin_reader()
+        stop_requested = asyncio.create_task(self._stop_event.wait())
         
         while self.running:
             try:
-                # Get user input
-                user_input = input("💬 You: ").strip()
+                sys.stdout.write("💬 You: ")
+                sys.stdout.flush()
+                
+                # Wait for a line or a shutdown signal, whichever comes first
+                next_line = asyncio.ensure_future(lines.get())
+                await asyncio.wait({next_line, stop_requested}, return_when=asyncio.FIRST_COMPLETED)
+                if stop_requested.done() or next_line.result() is None:
+                    next_line.cancel()
+                    print("\n👋 Goodbye!")
+                    break
+                
+                user_input = next_line.result().strip()
                 
                 if not user_input:
                     continue
@@ -105,22 +135,60 @@ class TradingBotApp:
                 else:
                     await self._handle_natural_language(user_input)
                     
-            except KeyboardInterrupt:
-                print("\n👋 Goodbye!")
-                break
-            except EOFError:
-                print("\n👋 Goodbye!")
-                break
             except Exception as e:
                 print(f"❌ Error: {e}")
                 logger.error(f"Console error: {e}")
+        
+        stop_requested.cancel()
+    
+    @staticmethod
+    def _start_stdin_reader() -> asyncio.Queue:
+        """
+        Read stdin lines on a daemon thread so the event loop keeps running while
+        the user types.
+        
+        The thread uses os.read rather than input(): a thread blocked in input()
+        holds the stdin buffer lock and stops the interpreter from shutting down.
+        
+        Returns:
+            Queue receiving each line as it is entered, then None at end of input
+        """
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue = asyncio.Queue()
+        
+        def put(line):
+            try:
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+            except RuntimeError:
+                pass  # Event loop already closed
+        
+        def read():
+            fd = sys.stdin.fileno()
+            pending = b""
+            while True:
+                try:
+                    chunk = os.read(fd, 4096)
+                except OSError:
+                    chunk = b""
+                pending += chunk
+                *complete, pending = pending.split(b"\n")
+                if not chunk and pending:
+                    complete.append(pending)
+                for line in complete:
+                    put(line.decode(errors="replace"))
+                if not chunk:
+                    put(None)
+                    return
+        
+        threading.Thread(target=read, daemon=True).start()
+        return lines
     
     async def _handle_command(self, command: str):
         """Handle console commands."""
         command = command.lower().strip()
         
         if command == '/help':
-            await self._show_welcome()
+            self._show_welcome()
             
         elif command == '/quit' or command == '/exit':
             print("👋 Shutting down...")
@@ -147,20 +215,16 @@ class TradingBotApp:
         except Exception as e:
             print(f"❌ Error processing request: {e}")
             logger.error(f"Natural language error: {e}")
-    
-    def handle_signal(self, signum, frame):
-        """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, shutting down...")
-        asyncio.create_task(self.stop())
 
 
 async def main():
     """Main entry point."""
     app = TradingBotApp()
     
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, app.handle_signal)
-    signal.signal(signal.SIGTERM, app.handle_signal)
+    # Signals only wake the console loop; shutdown then runs in finally
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, app._stop_event.set)
     
     try:
         await app.start()
@@ -174,4 +238,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -18,6 +18,7 @@ from .config import Config
 from .binance_handler import BinanceHandler
 from .ai_factory import AIFactory
 from .functionSelector import FunctionSelector
+from .utils import install_uvloop
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +35,28 @@ class TelegramBot:
         
         # Build application with error handling - compatible with v20+
         try:
-            self.application = Application.builder().token(config.telegram_bot_token).build()
+            self.application = (
+                Application.builder()
+                .token(config.telegram_bot_token)
+                .post_init(self._post_init)
+                .post_shutdown(self._post_shutdown)
+                .build()
+            )
             self._setup_handlers()
             logger.info("Telegram bot initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing Telegram bot: {e}")
             raise
     
+    async def _post_init(self, application: Application):
+        """Start AI warmup once the application is running, whichever runner started it."""
+        self.function_selector.warmup()
+    
+    async def _post_shutdown(self, application: Application):
+        """Close the selector's pending tasks, then the shared Binance session, after the application shuts down."""
+        await self.function_selector.close()
+        await self.binance.close()
+    
     def _setup_handlers(self):
         """Set up message and command handlers."""
         # Command handlers
@@ -243,6 +259,8 @@ I'm your AI-powered trading assistant! I can help you:
         logger.info("Stopping Telegram bot...")
         await self.application.stop()
         await self.application.shutdown()
+        # Application.shutdown() does not run the post_shutdown hook; only run_polling() does
+        await self._post_shutdown(self.application)
         logger.info("Telegram bot stopped.")
 
 
@@ -278,4 +296,5 @@ async def main():
 
 if __name__ == "__main__":
     import asyncio
+    install_uvloop()
     asyncio.run(main())
@@ -0,0 +1,23 @@
+"""
+Shared helpers for the bot entry points and handlers.
+"""
+
+import json
+
+# Prefer orjson's faster parser when available
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+
+def install_uvloop():
+    """Use uvloop's faster event loop when available (not supported on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
@@ -28,6 +28,7 @@ class WhatsAppBot:
         self.pending_trades: Dict[str, TradingAnalysis] = {}
         self.whatsapp_process = None
         self.is_running = False
+        self._monitor_task: Optional[asyncio.Task] = None
         
     async def start(self):
         """Start the WhatsApp bot."""
@@ -53,7 +54,8 @@ class WhatsAppBot:
             logger.info("WhatsApp bot started successfully!")
             
             # Start message monitoring
-            await self._monitor_messages()
+            self._monitor_task = asyncio.create_task(self._monitor_messages())
+            await self._monitor_task
             
         except Exception as e:
             logger.error(f"Failed to start WhatsApp bot: {e}")
@@ -68,6 +70,12 @@ class WhatsAppBot:
             self.whatsapp_process.terminate()
             self.whatsapp_process.wait()
         
+        # Let the message being processed finish before its Binance session goes away
+        if self._monitor_task:
+            await self._monitor_task
+        
+        await self.binance.close()
+        
         logger.info("WhatsApp bot stopped.")
     
     async def _monitor_messages(self):
@@ -108,7 +116,7 @@ class WhatsAppBot:
             sender = message.get('from', '')
             text = message.get('body', '')
             
-            logger.info(f"Received message from {sender}: {text}")
+            logger.info("Received message from %s: %s", sender, text)
             
             # Check if it's a command
             if text.startswith('/'):
@@ -264,7 +272,7 @@ Just ask me questions like:
             with open(outgoing_file, 'w') as f:
                 json.dump(outgoing_messages, f, indent=2)
                 
-            logger.info(f"Queued message to {to}: {message[:50]}...")
+            logger.info("Queued message to %s: %.50s...", to, message)
             
         except Exception as e:
             logger.error(f"Error sending message: {e}")
@@ -273,20 +281,20 @@ Just ask me questions like:
         """Get system status message."""
         message = "🔄 *System Status:*\n\n"
         
-        # Check AI provider
-        try:
-            ai_status = await self.ai_handler.health_check()
+        # Check AI provider and Binance concurrently
+        ai_status, btc_price = await asyncio.gather(
+            self.ai_handler.health_check(),
+            self.binance.get_current_btc_price(),
+            return_exceptions=True
+        )
+        
+        if isinstance(ai_status, BaseException):
+            message += f"🤖 AI: ❌ Error\n"
+        else:
             provider_name = self.config.ai_provider.upper()
             message += f"🤖 {provider_name} AI: {'✅ Online' if ai_status else '❌ Offline'}\n"
-        except:
-            message += f"🤖 AI: ❌ Error\n"
         
-        # Check Binance
-        try:
-            await self.binance.get_current_btc_price()
-            binance_status = "✅ Online"
-        except Exception:
-            binance_status = "❌ Offline"
+        binance_status = "❌ Offline" if isinstance(btc_price, BaseException) else "✅ Online"
         
         message += f"📈 Binance API: {binance_status}\n"
         message += f"🔒 Trading: {'✅ Enabled' if self.config.enable_trading else '❌ Disabled'}\n"
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Test the local fast-intent router that skips LLM classification."""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from src.functionSelector import FunctionSelector
+
+# Message -> intent the router must pick without asking the LLM
+FAST_HITS = {
+    "/price": "btc_price_info",
+    "What's the current BTC price?": "btc_price_info",
+    "bitcoin price": "btc_price_info",
+    "/balance": "usdt_balance_info",
+    "/usdt": "usdt_balance_info",
+    "How much USDT do I have?": "usdt_balance_info",
+    "what is my balance": "usdt_balance_info",
+    "/portfolio": "portfolio_value",
+    "What's my portfolio worth?": "portfolio_value",
+    "how much is my portfolio value": "portfolio_value",
+    "/help": "general_consult",
+}
+
+# Messages that must fall through to the LLM classifier
+FAST_MISSES = [
+    "Should I buy Bitcoin now?",
+    "What's the BTC price trend this week?",
+    "/status",
+    "/pricey",
+    "price of btc in euros please",
+    "how much usdt do i have and should I buy?",
+]
+
+# Premium provider mentions always go to the LLM so the premium request is detected
+PREMIUM_MISSES = [
+    "/price gemini",
+    "What's the BTC price? Ask OpenAI",
+    "/portfolio with Gemini",
+]
+
+
+def test_fast_intent_hits():
+    """Commands and trivial questions are routed locally to the right intent."""
+    for message, expected in FAST_HITS.items():
+        intent = FunctionSelector._match_fast_intent(message)
+        assert intent is not None, f"'{message}' should be routed locally"
+        assert intent.intent == expected, f"'{message}' routed to {intent.intent}, expected {expected}"
+        assert not intent.premium_ai_requested
+
+
+def test_fast_intent_misses():
+    """Anything that is not an exact command or trivial question goes to the LLM."""
+    for message in FAST_MISSES:
+        assert FunctionSelector._match_fast_intent(message) is None, f"'{message}' should reach the LLM"
+
+
+def test_premium_mentions_fall_through():
+    """Naming a premium provider bypasses the fast router."""
+    for message in PREMIUM_MISSES:
+        assert FunctionSelector._match_fast_intent(message) is None, f"'{message}' should reach the LLM"
+
+
+if __name__ == "__main__":
+    print("🎯 Testing fast intent routing...")
+    print("=" * 50)
+    for test in (test_fast_intent_hits, test_fast_intent_misses, test_premium_mentions_fall_through):
+        test()
+        print(f"✅ {test.__name__}")
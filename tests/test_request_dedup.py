@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Test single-flight deduplication of Binance fetches and LLM requests."""
+
+import asyncio
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from src.binance_handler import BinanceHandler
+from src.config import Config
+from src.functionSelector import FunctionSelector, ANALYSIS_CACHE_TTL, INTENT_CACHE_TTL
+
+
+def make_config() -> Config:
+    """Minimal offline configuration (no Redis, no real credentials)."""
+    return Config(
+        telegram_bot_token="test",
+        telegram_chat_id="0",
+        binance_api_key="test",
+        binance_secret_key="test"
+    )
+
+
+class CountingFetch:
+    """Awaitable factory that counts calls and can fail on demand."""
+    
+    def __init__(self, result="value", fail_first: bool = False):
+        self.calls = 0
+        self.result = result
+        self.fail_first = fail_first
+    
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail_first and self.calls == 1:
+            raise RuntimeError("upstream failure")
+        return self.result
+
+
+async def _binance_concurrent_callers_share_one_fetch():
+    binance = BinanceHandler(make_config())
+    fetch = CountingFetch()
+    try:
+        results = await asyncio.gather(*(binance._cached("key", 60, fetch) for _ in range(5)))
+        assert results == ["value"] * 5
+        assert fetch.calls == 1, f"expected one fetch, got {fetch.calls}"
+        
+        # Fresh value is served from the cache
+        assert await binance._cached("key", 60, fetch) == "value"
+        assert fetch.calls == 1
+    finally:
+        await binance.close()
+
+
+async def _binance_failure_is_not_cached():
+    binance = BinanceHandler(make_config())
+    fetch = CountingFetch(fail_first=True)
+    try:
+        results = await asyncio.gather(*(binance._cached("key", 60, fetch) for _ in range(3)),
+                                       return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results), results
+        assert fetch.calls == 1
+        assert "key" not in binance._cache
+        
+        # The next caller retries instead of getting the stored error
+        assert await binance._cached("key", 60, fetch) == "value"
+        assert fetch.calls == 2
+    finally:
+        await binance.close()
+
+
+async def _llm_concurrent_callers_share_one_request():
+    config = make_config()
+    binance = BinanceHandler(config)
+    selector = FunctionSelector(config, binance, object())
+    request = CountingFetch()
+    cache = selector._intent_cache
+    try:
+        results = await asyncio.gather(*(selector._cached_llm(cache, "key", INTENT_CACHE_TTL, request)
+                                         for _ in range(5)))
+        assert results == ["value"] * 5
+        assert request.calls == 1, f"expected one LLM request, got {request.calls}"
+        assert not selector._llm_inflight
+    finally:
+        await selector.close()
+        await binance.close()
+
+
+async def _llm_failure_is_not_cached():
+    config = make_config()
+    binance = BinanceHandler(config)
+    selector = FunctionSelector(config, binance, object())
+    request = CountingFetch(fail_first=True)
+    cache = selector._analysis_cache
+    try:
+        results = await asyncio.gather(*(selector._cached_llm(cache, "key", ANALYSIS_CACHE_TTL, request)
+                                         for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results), results
+        assert request.calls == 1
+        assert "key" not in cache
+        
+        assert await selector._cached_llm(cache, "key", ANALYSIS_CACHE_TTL, request) == "value"
+        assert request.calls == 2
+    finally:
+        await selector.close()
+        await binance.close()
+
+
+def test_binance_concurrent_callers_share_one_fetch():
+    """Concurrent Binance lookups for one key trigger a single fetch."""
+    asyncio.run(_binance_concurrent_callers_share_one_fetch())
+
+
+def test_binance_failure_is_not_cached():
+    """A failed Binance fetch reaches every waiter and is retried by the next caller."""
+    asyncio.run(_binance_failure_is_not_cached())
+
+
+def test_llm_concurrent_callers_share_one_request():
+    """Concurrent identical LLM requests are sent once."""
+    asyncio.run(_llm_concurrent_callers_share_one_request())
+
+
+def test_llm_failure_is_not_cached():
+    """A failed LLM request reaches every waiter and is retried by the next caller."""
+    asyncio.run(_llm_failure_is_not_cached())
+
+
+if __name__ == "__main__":
+    print("🔁 Testing request deduplication...")
+    print("=" * 50)
+    for test in (test_binance_concurrent_callers_share_one_fetch, test_binance_failure_is_not_cached,
+                 test_llm_concurrent_callers_share_one_request, test_llm_failure_is_not_cached):
+        test()
+        print(f"✅ {test.__name__}")